@@ -1,9 +1,12 @@
 """Document service for managing document generation."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Tuple, List
-import uuid
-from datetime import datetime
+from typing import Dict, Any, Tuple, List, Optional
+import gc
+import os
+import secrets
+import time
 
 from ..generators import WordGenerator, ExcelGenerator, PowerPointGenerator
 from ..generators.powerpoint_advanced_generator import PowerPointAdvancedGenerator
@@ -11,6 +14,10 @@ from ..models import GenerateDocumentRequest, GenerateDocumentResponse, Template
 from ..config import settings
 
 
+# Outputs above this size trigger a garbage collection once generation is done
+_GC_THRESHOLD_BYTES = 1 << 20
+
+
 class DocumentService:
     """Service for managing document generation."""
     
@@ -31,33 +38,120 @@ class DocumentService:
             "excel": ".xlsx",
             "powerpoint": ".pptx",
         }
+        
+        # Directory signature and result of the last list_templates() scan
+        self._templates_cache: Optional[Tuple[tuple, List[TemplateInfo]]] = None
+        # Template names by document type, as of the last directory scan
+        self._known_templates: Dict[str, set] = {}
     
-    def list_templates(self) -> list[TemplateInfo]:
-        """List all available templates."""
-        templates = []
+    def _scan_templates_dir(self) -> Tuple[tuple, Dict[str, List[Path]]]:
+        """
+        Scan the templates directory in a single os.scandir() pass.
         
-        for doc_type, ext in self.extensions.items():
-            template_files = list(settings.templates_dir.glob(f"*{ext}"))
-            
-            for template_file in template_files:
-                try:
-                    generator = self.generators.get(doc_type)
-                    if not generator:
+        Returns a signature of the directory (its mtime plus the name, mtime and
+        size of every template file) and the template files grouped by document type.
+        Added, removed, renamed and edited templates all change the signature.
+        """
+        templates_dir = settings.templates_dir
+        template_files = {doc_type: [] for doc_type in self.extensions}
+        file_stamps = []
+        
+        try:
+            dir_mtime_ns = templates_dir.stat().st_mtime_ns
+            with os.scandir(templates_dir) as entries:
+                for entry in entries:
+                    # Hidden files are skipped, as glob() did
+                    if entry.name.startswith(".") or not entry.is_file():
                         continue
-                    
-                    fields = generator.get_template_fields(template_file)
-                    templates.append(TemplateInfo(
-                        name=template_file.stem,
-                        document_type=doc_type,
-                        description=f"Template for {doc_type} documents",
-                        fields=fields
-                    ))
-                except Exception:
-                    # Silently skip templates that can't be read
-                    # Don't log to avoid breaking MCP protocol
-                    continue
-        
-        return templates
+                    for doc_type, ext in self.extensions.items():
+                        if entry.name.endswith(ext):
+                            template_files[doc_type].append(Path(entry.path))
+                            stat_result = entry.stat()
+                            file_stamps.append((entry.name, stat_result.st_mtime_ns, stat_result.st_size))
+                            break
+        except FileNotFoundError:
+            return (), template_files
+        
+        for files in template_files.values():
+            files.sort()
+        
+        return (dir_mtime_ns, tuple(sorted(file_stamps))), template_files
+    
+    def list_templates(self) -> list[TemplateInfo]:
+        """
+        List all available templates.
+        
+        The result is cached and only rebuilt when the templates directory changes.
+        """
+        signature, template_files = self._scan_templates_dir()
+        self._known_templates = {
+            doc_type: {path.stem for path in files} for doc_type, files in template_files.items()
+        }
+        if self._templates_cache is not None and self._templates_cache[0] == signature:
+            return list(self._templates_cache[1])
+        
+        doc_types = [doc_type for doc_type, files in template_files.items() for _ in files]
+        paths = [path for files in template_files.values() for path in files]
+        
+        # Templates are independent and parsing is mostly zip/XML work in C,
+        # so parse them concurrently; a single template isn't worth a pool,
+        # and a few workers already keep the disk and the parsers busy
+        if len(paths) <= 1:
+            results = list(map(self._load_template_info, doc_types, paths))
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+                results = list(executor.map(self._load_template_info, doc_types, paths))
+        templates = [info for info in results if info is not None]
+        
+        self._templates_cache = (signature, templates)
+        return list(templates)
+    
+    def get_template(self, template_name: str, document_type: str) -> Optional[TemplateInfo]:
+        """
+        Get the TemplateInfo for a single template, or None if it doesn't exist.
+        
+        Only the requested file is parsed, unlike filtering list_templates().
+        """
+        template_ext = self.extensions.get(document_type)
+        if template_ext is None:
+            return None
+        
+        template_path = settings.templates_dir / f"{template_name}{template_ext}"
+        if not self._template_exists(document_type, template_name, template_path):
+            return None
+        
+        return self._load_template_info(document_type, template_path)
+    
+    def _load_template_info(self, doc_type: str, template_file: Path) -> Optional[TemplateInfo]:
+        """Build the TemplateInfo for one template file, or None if it can't be read."""
+        generator = self.generators.get(doc_type)
+        if not generator:
+            return None
+        
+        try:
+            fields = generator.get_template_fields(template_file)
+        except Exception:
+            # Silently skip templates that can't be read
+            # Don't log to avoid breaking MCP protocol
+            return None
+        
+        return TemplateInfo(
+            name=template_file.stem,
+            document_type=doc_type,
+            description=f"Template for {doc_type} documents",
+            fields=fields
+        )
+    
+    def _template_exists(self, doc_type: str, template_name: str, template_path: Path) -> bool:
+        """
+        Check whether a template exists.
+        
+        Names seen by the last directory scan are trusted without a stat() call;
+        anything else (including a cold cache) falls back to the filesystem.
+        """
+        if template_name in self._known_templates.get(doc_type, ()):
+            return True
+        return template_path.exists()
     
     def get_template_slide_types(self, template_name: str) -> List[Dict[str, Any]]:
         """
@@ -66,7 +160,7 @@ class DocumentService:
         """
         template_path = settings.templates_dir / f"{template_name}.pptx"
         
-        if not template_path.exists():
+        if not self._template_exists("powerpoint", template_name, template_path):
             raise FileNotFoundError(f"Template '{template_name}' not found")
         
         return self.powerpoint_advanced_generator.get_template_slide_types(template_path)
@@ -83,15 +177,15 @@ class DocumentService:
             template_ext = self.extensions[request.document_type]
             template_path = settings.templates_dir / f"{request.template_name}{template_ext}"
             
-            if not template_path.exists():
+            if not self._template_exists(request.document_type, request.template_name, template_path):
                 return GenerateDocumentResponse(
                     success=False,
                     message=f"Template '{request.template_name}' not found"
                 ), None
             
             # Generate a unique filename
-            document_id = str(uuid.uuid4())
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            document_id = secrets.token_hex(8)
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
             output_filename = f"{request.template_name}_{timestamp}_{document_id[:8]}{template_ext}"
             output_path = settings.output_dir / output_filename
             
@@ -102,7 +196,7 @@ class DocumentService:
             if request.document_type == "powerpoint" and request.slides:
                 self.powerpoint_advanced_generator.generate_from_slides(
                     template_path, 
-                    [slide.dict() for slide in request.slides], 
+                    request.slides, 
                     output_path
                 )
             else:
@@ -114,6 +208,13 @@ class DocumentService:
                     ), None
                 generator.generate(template_path, request.fields, output_path)
             
+            # The python-docx/openpyxl/python-pptx object graphs are full of
+            # reference cycles, so a large document's XML trees would otherwise
+            # linger until the cyclic GC happens to run; collect them now to keep
+            # the long-lived server's peak memory down
+            if output_path.stat().st_size > _GC_THRESHOLD_BYTES:
+                gc.collect()
+            
             # Prepare response
             response = GenerateDocumentResponse(
                 success=True,
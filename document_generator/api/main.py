@@ -1,6 +1,11 @@
 """FastAPI application for document generation."""
 
-from fastapi import FastAPI, HTTPException
+import asyncio
+import os
+import stat
+from typing import Any, Dict
+
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.responses import FileResponse, JSONResponse
 from pathlib import Path
 
@@ -18,9 +23,16 @@ app = FastAPI(
 # Create document service
 document_service = DocumentService()
 
+# Media types for downloads, by file extension
+MEDIA_TYPES = {
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ".xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ".pptx": "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+}
+
 
 @app.get("/")
-async def root():
+async def root() -> Dict[str, Any]:
     """Root endpoint with API information."""
     return {
         "name": settings.api_title,
@@ -28,6 +40,7 @@ async def root():
         "description": settings.api_description,
         "endpoints": {
             "generate": "/api/generate",
+            "generate_batch": "/api/generate/batch",
             "templates": "/api/templates",
             "download": "/api/download/{filename}",
             "health": "/health"
@@ -36,7 +49,7 @@ async def root():
 
 
 @app.get("/health")
-async def health():
+async def health() -> Dict[str, str]:
     """Health check endpoint."""
     return {"status": "healthy"}
 
@@ -44,11 +57,12 @@ async def health():
 @app.get("/api/templates", response_model=list[TemplateInfo])
 async def list_templates():
     """List all available templates."""
-    return document_service.list_templates()
+    # Template parsing is blocking; keep it off the event loop
+    return await asyncio.to_thread(document_service.list_templates)
 
 
 @app.get("/api/templates/{template_name}/slides")
-async def get_template_slide_types(template_name: str):
+async def get_template_slide_types(template_name: str) -> Dict[str, Any]:
     """
     Get slide type information for a PowerPoint template.
     
@@ -58,7 +72,7 @@ async def get_template_slide_types(template_name: str):
     - placeholders: Dictionary of field definitions with types
     """
     try:
-        slide_types = document_service.get_template_slide_types(template_name)
+        slide_types = await asyncio.to_thread(document_service.get_template_slide_types, template_name)
         return {"template_name": template_name, "slide_types": slide_types}
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -76,44 +90,76 @@ async def generate_document(request: GenerateDocumentRequest):
     - **fields**: Dictionary of field names and values to populate
     - **return_type**: How to return the document (binary or download_link)
     """
-    response, output_path = document_service.generate_document(request)
+    # Generation does blocking file I/O and XML work; run it in a worker thread
+    response, output_path = await asyncio.to_thread(document_service.generate_document, request)
     
     if not response.success:
         raise HTTPException(status_code=400, detail=response.message)
     
     # If binary return type, return the file directly
-    if request.return_type == "binary" and output_path and output_path.exists():
-        return FileResponse(
-            path=output_path,
-            filename=response.filename,
-            media_type="application/octet-stream"
-        )
+    if request.return_type == "binary" and output_path:
+        try:
+            stat_result = os.stat(output_path)
+        except FileNotFoundError:
+            stat_result = None
+        if stat_result is not None:
+            # Passing the stat result saves FileResponse a second stat() call
+            return FileResponse(
+                path=output_path,
+                filename=response.filename,
+                media_type="application/octet-stream",
+                stat_result=stat_result
+            )
     
     # Otherwise return the response with download link
     return response
 
 
+@app.post("/api/generate/batch", response_model=list[GenerateDocumentResponse])
+async def generate_documents_batch(
+    requests: list[GenerateDocumentRequest],
+    max_concurrency: int = Query(16, ge=1, description="Maximum number of documents generated at once"),
+):
+    """
+    Generate several documents in one call.
+    
+    Documents are generated concurrently in worker threads, at most
+    **max_concurrency** at a time. Every request gets its own response in the
+    same order, and a failed document does not abort the rest of the batch.
+    Files are never streamed back; use `download_link` to get URLs.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def generate_one(request: GenerateDocumentRequest) -> GenerateDocumentResponse:
+        async with semaphore:
+            response, _ = await asyncio.to_thread(document_service.generate_document, request)
+            return response
+    
+    return await asyncio.gather(*(generate_one(request) for request in requests))
+
+
 @app.get("/api/download/{filename}")
 async def download_document(filename: str):
     """Download a generated document."""
     file_path = settings.output_dir / filename
     
-    if not file_path.exists():
+    # A single stat() both checks the file and is reused by FileResponse
+    try:
+        stat_result = os.stat(file_path)
+    except FileNotFoundError:
+        stat_result = None
+    
+    if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
         raise HTTPException(status_code=404, detail="File not found")
     
     # Determine media type based on extension
-    media_types = {
-        ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-        ".xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        ".pptx": "application/vnd.openxmlformats-officedocument.presentationml.presentation",
-    }
-    
-    media_type = media_types.get(file_path.suffix, "application/octet-stream")
+    media_type = MEDIA_TYPES.get(file_path.suffix, "application/octet-stream")
     
     return FileResponse(
         path=file_path,
         filename=filename,
-        media_type=media_type
+        media_type=media_type,
+        stat_result=stat_result
     )
 
 
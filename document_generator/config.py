@@ -31,6 +31,7 @@ class Settings(BaseSettings):
 
 settings = Settings()
 
-# Ensure directories exist
-settings.templates_dir.mkdir(parents=True, exist_ok=True)
-settings.output_dir.mkdir(parents=True, exist_ok=True)
+# Ensure directories exist; a warm start only pays for one stat() each
+for _directory in (settings.templates_dir, settings.output_dir):
+    if not _directory.is_dir():
+        _directory.mkdir(parents=True, exist_ok=True)
@@ -1,13 +1,178 @@
 """Base document generator interface."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from collections import OrderedDict
+from functools import lru_cache
+from io import BytesIO
+from typing import Dict, Any, Callable, FrozenSet, Optional, Tuple
 from pathlib import Path
+import os
+import re
+import threading
+
+
+class _TemplateCache:
+    """
+    Values derived from template files, keyed by _template_key() tuples.
+    
+    Holds one version per path, so an edited template replaces its stale entry
+    instead of sitting next to it. Least recently used paths are evicted past
+    max_entries entries or, when weigh is given, past max_weight in total; a
+    single value heavier than max_weight is returned without being cached.
+    """
+    
+    def __init__(
+        self,
+        max_entries: int,
+        max_weight: Optional[int] = None,
+        weigh: Optional[Callable[[Any], int]] = None,
+    ):
+        self.max_entries = max_entries
+        self.max_weight = max_weight
+        self.weigh = weigh
+        # path -> (mtime_ns, size, value, weight), least recently used first
+        self._entries: "OrderedDict[str, Tuple[int, int, Any, int]]" = OrderedDict()
+        self._weight = 0
+        self._lock = threading.Lock()
+    
+    def get_or_build(self, key: Tuple[str, int, int], build: Callable[[], Any]) -> Any:
+        """Return the value cached for key, calling build() to create it on a miss."""
+        path_str, mtime_ns, size = key
+        with self._lock:
+            entry = self._entries.get(path_str)
+            if entry is not None and entry[0] == mtime_ns and entry[1] == size:
+                self._entries.move_to_end(path_str)
+                return entry[2]
+        
+        # Build outside the lock so a slow template doesn't block the others
+        value = build()
+        weight = self.weigh(value) if self.weigh is not None else 0
+        if self.max_weight is not None and weight > self.max_weight:
+            return value
+        
+        with self._lock:
+            stale = self._entries.pop(path_str, None)
+            if stale is not None:
+                self._weight -= stale[3]
+            self._entries[path_str] = (mtime_ns, size, value, weight)
+            self._weight += weight
+            while len(self._entries) > self.max_entries or (
+                self.max_weight is not None and self._weight > self.max_weight
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._weight -= evicted[3]
+        return value
+
+
+# Template contents, shared by all generators; bounded by total bytes
+_TEMPLATE_BYTES = _TemplateCache(max_entries=256, max_weight=64 << 20, weigh=len)
+
+
+def _read_template_bytes(path_str: str, mtime_ns: int, size: int) -> bytes:
+    """
+    Read a template file from disk.
+    
+    Cached per path and shared by all generators, so hot templates are only
+    read once; a changed file gets a new mtime or size and is read again.
+    """
+    return _TEMPLATE_BYTES.get_or_build((path_str, mtime_ns, size), Path(path_str).read_bytes)
+
+
+@lru_cache(maxsize=256)
+def _placeholder_pattern(placeholders: FrozenSet[str]) -> re.Pattern:
+    """
+    Compile one alternation matching any of the given placeholders.
+    
+    Longest first, so none is shadowed by a shorter prefix. Cached per set of
+    placeholders, so repeated requests and slides of the same type reuse the
+    compiled pattern instead of rebuilding it.
+    """
+    return re.compile("|".join(
+        re.escape(placeholder) for placeholder in sorted(placeholders, key=len, reverse=True)
+    ))
 
 
 class DocumentGenerator(ABC):
     """Abstract base class for document generators."""
     
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Sorted placeholder names per template version; one cache per
+        # generator class, since each reads different parts of a template
+        cls._fields_cache = _TemplateCache(max_entries=64)
+    
+    def _template_key(self, template_path: Path) -> Tuple[str, int, int]:
+        """
+        Identify a template's current contents as (path, mtime_ns, size).
+        
+        Used as the key of every per-template cache. The size catches rewrites
+        that land within the filesystem's mtime granularity.
+        """
+        template_path = Path(template_path)
+        stat_result = template_path.stat()
+        return str(template_path), stat_result.st_mtime_ns, stat_result.st_size
+    
+    def _open_template(self, key: Tuple[str, int, int]) -> BytesIO:
+        """
+        Open the template version identified by key as an in-memory file.
+        
+        The bytes come from the shared cache, so an unchanged template is read
+        from disk once; each call gets its own file object to parse.
+        """
+        return BytesIO(_read_template_bytes(*key))
+    
+    def _save(self, document: Any, output_path: Path) -> Path:
+        """
+        Save a python-docx/openpyxl/python-pptx document to output_path.
+        
+        The document is serialized in memory and written with a single write to
+        a temporary file that then replaces output_path, so a concurrent
+        download never sees a half-written archive.
+        """
+        output_path = Path(output_path)
+        buffer = BytesIO()
+        document.save(buffer)
+        
+        temp_path = output_path.with_name(output_path.name + ".tmp")
+        try:
+            temp_path.write_bytes(buffer.getbuffer())
+            os.replace(temp_path, output_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        return output_path
+    
+    def _replace_in_runs(self, runs, pattern: re.Pattern, replace) -> None:
+        """
+        Apply `pattern.sub(replace, ...)` to the text of each run.
+        
+        Substituting run by run keeps each run's formatting. Only runs whose
+        text changes are written back, so untouched runs keep their XML.
+        """
+        for run in runs:
+            text = run.text
+            if "{{" not in text:
+                continue
+            new_text = pattern.sub(replace, text)
+            if new_text != text:
+                self._set_run_text(run, new_text)
+    
+    def _set_run_text(self, run, text: str) -> None:
+        """Replace the text of a run."""
+        run.text = text
+    
+    def _compile_replacements(self, fields: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Map each {{field_name}} placeholder to its string value.
+        
+        Called once per generate() call so every value is stringified once,
+        however many runs or cells its placeholder appears in.
+        """
+        return {
+            f"{{{{{field_name}}}}}": field_value if isinstance(field_value, str) else str(field_value)
+            for field_name, field_value in fields.items()
+        }
+    
     @abstractmethod
     def generate(self, template_path: Path, fields: Dict[str, Any], output_path: Path) -> Path:
         """
@@ -23,7 +188,6 @@ class DocumentGenerator(ABC):
         """
         pass
     
-    @abstractmethod
     def get_template_fields(self, template_path: Path) -> list[str]:
         """
         Extract field names from a template.
@@ -32,6 +196,21 @@ class DocumentGenerator(ABC):
             template_path: Path to the template file
             
         Returns:
-            List of field names found in the template
+            Sorted list of field names found in the template
+        """
+        key = self._template_key(template_path)
+        fields = self._fields_cache.get_or_build(key, lambda: self._extract_fields(self._open_template(key)))
+        return list(fields)
+    
+    @abstractmethod
+    def _extract_fields(self, template: BytesIO) -> Tuple[str, ...]:
+        """
+        Extract the sorted placeholder names from a template.
+        
+        Args:
+            template: The template file, opened in memory
+            
+        Returns:
+            Tuple of field names found in the template, sorted
         """
         pass
@@ -1,10 +1,35 @@
 """Excel document generator using openpyxl."""
 
+from io import BytesIO
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
+import html
 import re
+import zipfile
 from openpyxl import load_workbook
-from .base import DocumentGenerator
+from .base import DocumentGenerator, _TemplateCache
+
+
+# Placeholders in format {{field_name}}
+_PLACEHOLDER_RE = re.compile(r'\{\{([^}]+)\}\}')
+
+# Raw XML scanning used by get_template_fields(); NUL marks value boundaries
+_XML_PLACEHOLDER_RE = re.compile(rb'\{\{([^}\x00]+)\}\}')
+_XML_TAG_RE = re.compile(rb'<[^>]*>')
+# Content of each non-empty <c> cell element; a worksheet also holds text
+# generate() never fills, such as <headerFooter> and conditional-format formulas
+_XML_CELL_RE = re.compile(rb'<c(?:\s[^>]*)?(?<!/)>(.*?)</c>', re.S)
+
+# Coordinates of the placeholder cells per (template path, mtime_ns, size), as
+# (worksheet index, ((row, column), ...)) pairs; filled by the first generate()
+_PLACEHOLDER_CELLS = _TemplateCache(max_entries=64)
+
+def _is_text_part(name: str) -> bool:
+    """Whether an XLSX archive member can hold cell text (shared strings or a worksheet)."""
+    name = name.lower()
+    if name == "xl/sharedstrings.xml":
+        return True
+    return name.startswith("xl/worksheets/") and name.endswith(".xml") and "/_rels/" not in name
 
 
 class ExcelGenerator(DocumentGenerator):
@@ -16,41 +41,81 @@ class ExcelGenerator(DocumentGenerator):
         
         Placeholders in the template should be in the format {{field_name}}.
         """
-        # Load the template
-        wb = load_workbook(template_path)
-        
-        # Iterate through all worksheets
-        for sheet in wb.worksheets:
-            # Iterate through all cells
-            for row in sheet.iter_rows():
-                for cell in row:
-                    if cell.value and isinstance(cell.value, str):
-                        # Replace placeholders
-                        cell_value = cell.value
-                        for field_name, field_value in fields.items():
-                            placeholder = f"{{{{{field_name}}}}}"
-                            if placeholder in cell_value:
-                                cell_value = cell_value.replace(placeholder, str(field_value))
-                        cell.value = cell_value
+        # Stat the template once: the workbook and the placeholder-cell cache
+        # must describe the same version of the file, even if it is replaced
+        # mid-request
+        key = self._template_key(template_path)
+        
+        wb = load_workbook(self._open_template(key))
+        
+        # Unknown placeholders are left untouched
+        replacements = self._compile_replacements(fields)
+        replace = lambda m: replacements.get(m.group(0), m.group(0))
+        
+        # The cells holding placeholders are fixed per template; find them on the
+        # first call and afterwards visit only those cells
+        placeholder_cells = _PLACEHOLDER_CELLS.get_or_build(key, lambda: self._find_placeholder_cells(wb))
+        
+        worksheets = wb.worksheets
+        for index, coordinates in placeholder_cells:
+            cells = worksheets[index]._cells
+            for coordinate in coordinates:
+                cell = cells.get(coordinate)
+                if cell is None:
+                    continue
+                value = cell.value
+                if not isinstance(value, str):
+                    continue
+                # Replace all placeholders in a single pass
+                new_value = _PLACEHOLDER_RE.sub(replace, value)
+                if new_value != value:
+                    cell.value = new_value
         
         # Save the workbook
-        wb.save(output_path)
-        return output_path
+        return self._save(wb, output_path)
     
-    def get_template_fields(self, template_path: Path) -> list[str]:
-        """Extract field names from an Excel template."""
-        wb = load_workbook(template_path)
-        fields = set()
+    def _find_placeholder_cells(self, wb) -> Tuple[Tuple[int, Tuple[Tuple[int, int], ...]], ...]:
+        """Collect the coordinates of the cells whose value contains a placeholder, per worksheet."""
+        placeholder_cells = []
+        for index, sheet in enumerate(wb.worksheets):
+            # Visit only the populated cells. iter_rows() would create (and later
+            # save) an empty Cell for every coordinate in the used range, which
+            # dominates on large or sparse sheets.
+            coordinates: List[Tuple[int, int]] = []
+            for coordinate, cell in sheet._cells.items():
+                value = cell.value
+                if isinstance(value, str) and "{{" in value:
+                    coordinates.append(coordinate)
+            if coordinates:
+                placeholder_cells.append((index, tuple(coordinates)))
+        return tuple(placeholder_cells)
+    
+    def _extract_fields(self, template: BytesIO) -> Tuple[str, ...]:
+        """
+        Extract the sorted placeholder names from an Excel template.
         
-        # Find placeholders in format {{field_name}}
-        pattern = r'\{\{([^}]+)\}\}'
+        Scans the raw XML of the shared strings table and the worksheet cells
+        instead of loading the workbook through openpyxl. Text lives almost
+        entirely in sharedStrings.xml; the cells only add inline strings and
+        formulas.
+        """
+        fields = set()
         
-        # Search in all worksheets
-        for sheet in wb.worksheets:
-            for row in sheet.iter_rows():
-                for cell in row:
-                    if cell.value and isinstance(cell.value, str):
-                        matches = re.findall(pattern, cell.value)
-                        fields.update(matches)
+        with zipfile.ZipFile(template) as archive:
+            for name in archive.namelist():
+                if not _is_text_part(name):
+                    continue
+                data = archive.read(name)
+                if b"{" not in data:
+                    continue
+                if name.lower() != "xl/sharedstrings.xml":
+                    # Worksheet: keep only the cells, the one place generate() replaces in
+                    data = b"</c>".join(_XML_CELL_RE.findall(data))
+                # Mark string/cell boundaries so a match can't span two values, then
+                # drop the markup so placeholders split across rich-text runs still match
+                data = data.replace(b"</si>", b"\x00").replace(b"</c>", b"\x00")
+                text = _XML_TAG_RE.sub(b"", data)
+                for match in _XML_PLACEHOLDER_RE.findall(text):
+                    fields.add(html.unescape(match.decode("utf-8")))
         
-        return sorted(list(fields))
+        return tuple(sorted(fields))
@@ -1,14 +1,50 @@
 """Advanced PowerPoint generator with slide composition capabilities."""
 
+from bisect import bisect_left, bisect_right
+from copy import deepcopy
+from io import BytesIO
+from itertools import accumulate
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 import re
 import json
+from lxml import etree
 from pptx import Presentation
+from pptx.oxml.ns import qn
+from pptx.shapes.placeholder import PicturePlaceholder
 from pptx.util import Pt
-from copy import deepcopy
-from .base import DocumentGenerator
+from .base import DocumentGenerator, _TemplateCache, _placeholder_pattern, _read_template_bytes
+
+
+# Placeholders in format {{field_name}}
+_PLACEHOLDER_RE = re.compile(r'\{\{([^}]+)\}\}')
+
+# Paragraphs of the slide's top-level text shapes and tables, and the text of a
+# paragraph's runs; the scope get_template_fields() has always searched
+_NAMESPACES = {
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+}
+_TEXT_PARAGRAPHS_XPATH = etree.XPath(
+    './p:cSld/p:spTree/p:sp/p:txBody/a:p | ./p:cSld/p:spTree/p:graphicFrame/a:graphic/a:graphicData/a:tbl//a:p',
+    namespaces=_NAMESPACES,
+)
+_RUN_TEXT_XPATH = etree.XPath('.//a:t/text()', namespaces=_NAMESPACES)
+
+# What copying a template shape can reasonably fail with (odd or linked images,
+# unsupported image formats, out-of-range values); anything else is a bug
+_COPY_ERRORS = (AttributeError, KeyError, ValueError, OSError)
+
+# Parsed notes metadata of each slide, in slide order (None for a slide without
+# any), per (template path, mtime_ns, size); shared by get_template_slide_types()
+# and generate_from_slides()
+_SLIDE_METADATA = _TemplateCache(max_entries=64)
 
+# Characters python-pptx turns into <a:br/> line breaks when setting paragraph text
+_LINE_BREAK_RE = re.compile('\n|\v')
+
+# Left/right double and single curly quotes -> straight quotes
+_SMART_QUOTES = str.maketrans({'\u201c': '"', '\u201d': '"', '\u2018': "'", '\u2019': "'"})
 
 class PowerPointAdvancedGenerator(DocumentGenerator):
     """Advanced generator for composing PowerPoint presentations from slide layouts with metadata."""
@@ -23,13 +59,14 @@ class PowerPointAdvancedGenerator(DocumentGenerator):
             return None
         
         notes_text = slide.notes_slide.notes_text_frame.text.strip()
-        if not notes_text:
+        # Metadata is a JSON object (or array); plain speaker notes are turned
+        # away here without a translate pass or a failed json.loads
+        if not notes_text or notes_text[0] not in "{[":
             return None
         
         # Replace smart/curly quotes with straight quotes
         # PowerPoint often auto-converts straight quotes to smart quotes
-        notes_text = notes_text.replace('\u201c', '"').replace('\u201d', '"')  # Left (") and right (") double quotes
-        notes_text = notes_text.replace('\u2018', "'").replace('\u2019', "'")  # Left (') and right (') single quotes
+        notes_text = notes_text.translate(_SMART_QUOTES)
         
         try:
             metadata = json.loads(notes_text)
@@ -44,12 +81,32 @@ class PowerPointAdvancedGenerator(DocumentGenerator):
         Returns:
             List of slide type information including slide_type, description, 
             placeholders, and slide_index.
+        
+        The notes are parsed once per template version; each call gets its own
+        copies, so callers may modify them.
+        """
+        slide_metadata = self._slide_metadata(self._template_key(template_path))
+        return deepcopy(list(self._read_slide_types(slide_metadata)))
+    
+    def _slide_metadata(self, key: Tuple[str, int, int], prs=None) -> Tuple[Optional[Dict[str, Any]], ...]:
+        """
+        Return the parsed notes metadata of each slide of a template version.
+        
+        The notes are parsed once per template version; prs, when given, must
+        be loaded from the same version. The dicts are shared, so treat them as
+        read-only.
         """
-        prs = Presentation(template_path)
+        def parse():
+            slides = (prs or Presentation(self._open_template(key))).slides
+            return tuple(self.parse_slide_metadata(slide) for slide in slides)
+        
+        return _SLIDE_METADATA.get_or_build(key, parse)
+    
+    def _read_slide_types(self, slide_metadata) -> Tuple[Dict[str, Any], ...]:
+        """Collect the slide type information of every slide with metadata."""
         slide_types = []
         
-        for idx, slide in enumerate(prs.slides):
-            metadata = self.parse_slide_metadata(slide)
+        for idx, metadata in enumerate(slide_metadata):
             if metadata and "slide_type" in metadata:
                 slide_info = {
                     "slide_index": idx,
@@ -59,12 +116,12 @@ class PowerPointAdvancedGenerator(DocumentGenerator):
                 }
                 slide_types.append(slide_info)
         
-        return slide_types
+        return tuple(slide_types)
     
     def generate_from_slides(
         self, 
         template_path: Path, 
-        slides_data: List[Dict[str, Any]], 
+        slides_data: Sequence[Any], 
         output_path: Path
     ) -> Path:
         """
@@ -72,9 +129,11 @@ class PowerPointAdvancedGenerator(DocumentGenerator):
         
         Args:
             template_path: Path to the template with metadata in slide notes
-            slides_data: List of slide specifications, each containing:
+            slides_data: Sequence of slide specifications, each containing:
                 - slide_type: Type of slide to use (matches metadata)
                 - fields: Dictionary of field names and values for that slide
+                Specifications can be dicts or objects exposing these as
+                attributes (e.g. SlideSpec models or named tuples).
             output_path: Where to save the generated presentation
             
         Example slides_data:
@@ -89,13 +148,17 @@ class PowerPointAdvancedGenerator(DocumentGenerator):
                 }
             ]
         """
-        # Load the template
-        template_prs = Presentation(template_path)
+        # Read the template once; both presentations below are built from these
+        # bytes, and the cached metadata is keyed by the same stat
+        key = self._template_key(template_path)
+        template_bytes = _read_template_bytes(*key)
+        template_prs = Presentation(BytesIO(template_bytes))
+        slide_metadata = self._slide_metadata(key, template_prs)
         
         # Build a map of slide_type -> list of slide objects with that type
         slide_type_map = {}
         for idx, slide in enumerate(template_prs.slides):
-            metadata = self.parse_slide_metadata(slide)
+            metadata = slide_metadata[idx]
             if metadata and "slide_type" in metadata:
                 slide_type = metadata["slide_type"]
                 if slide_type not in slide_type_map:
@@ -103,14 +166,19 @@ class PowerPointAdvancedGenerator(DocumentGenerator):
                 slide_type_map[slide_type].append({
                     'index': idx,
                     'slide': slide,
-                    'metadata': metadata
+                    'metadata': metadata,
+                    'field_set': frozenset(metadata.get('placeholders', {}))
                 })
         
         # Build list of slides to keep (in order) with their data
         slides_to_build = []
         for slide_spec in slides_data:
-            slide_type = slide_spec.get("slide_type")
-            fields = slide_spec.get("fields", {})
+            if isinstance(slide_spec, dict):
+                slide_type = slide_spec.get("slide_type")
+                fields = slide_spec.get("fields", {})
+            else:
+                slide_type = slide_spec.slide_type
+                fields = slide_spec.fields
             
             # Find the template slide with this type
             if slide_type not in slide_type_map:
@@ -129,67 +197,74 @@ class PowerPointAdvancedGenerator(DocumentGenerator):
                 # Multiple slides with same type - pick based on field match
                 best_match = None
                 best_score = -1
+                requested_fields = fields.keys()
                 
                 for candidate in candidate_slides:
-                    candidate_fields = set(candidate['metadata'].get('placeholders', {}).keys())
-                    requested_fields = set(fields.keys())
-                    
                     # Count matching fields
-                    matches = len(candidate_fields & requested_fields)
+                    matches = len(candidate['field_set'] & requested_fields)
                     
                     # Prefer candidates that have most of the requested fields
                     if matches > best_score:
                         best_score = matches
                         best_match = candidate
+                        # No later candidate can beat covering every field
+                        if matches == len(requested_fields):
+                            break
                 
                 template_info = best_match if best_match else candidate_slides[0]
             
             slides_to_build.append({
-                'template_index': template_info['index'],
+                'template_slide': template_info['slide'],
                 'fields': fields,
                 'metadata': template_info['metadata']
             })
         
-        # Create new presentation from template (preserves themes, layouts, etc.)
-        import shutil
-        shutil.copy(template_path, output_path)
-        output_prs = Presentation(output_path)
+        # Create new presentation from template (preserves themes, layouts, etc.),
+        # straight from the template bytes rather than via a copy on disk
+        output_prs = Presentation(BytesIO(template_bytes))
         
-        # Delete all existing slides (in reverse)
-        slide_count = len(output_prs.slides)
-        for i in range(slide_count - 1, -1, -1):
-            rId = output_prs.slides._sldIdLst[i].rId
+        # Delete all existing slides in one pass: empty the slide id list first,
+        # then drop the now-unreferenced slide relationships
+        sld_id_lst = output_prs.slides._sldIdLst
+        slide_rIds = [sld_id.rId for sld_id in sld_id_lst]
+        for sld_id in list(sld_id_lst):
+            sld_id_lst.remove(sld_id)
+        for rId in slide_rIds:
             output_prs.part.drop_rel(rId)
-            del output_prs.slides._sldIdLst[i]
         
-        # Reload template to get fresh slide references
-        template_prs = Presentation(template_path)
+        # Index the layouts once instead of searching them for every slide. The
+        # first layout wins when names repeat, as the linear search did.
+        output_layouts = list(output_prs.slide_layouts)
+        layout_by_name = {}
+        for layout in output_layouts:
+            layout_by_name.setdefault(layout.name, layout)
+        template_layout_index = {
+            id(layout.element): idx for idx, layout in enumerate(template_prs.slide_layouts)
+        }
+        
+        # Output image part per template image part, so a picture on a template
+        # slide that is used many times is only embedded once
+        image_parts = {}
         
-        # Add slides by copying content from template slides
+        # Add slides by copying content from template slides (template_prs is
+        # only read from, so the slides found above can be copied directly)
         for build_info in slides_to_build:
-            template_idx = build_info['template_index']
-            template_slide = template_prs.slides[template_idx]
+            template_slide = build_info['template_slide']
             
             # Find the layout by name in the output presentation
-            layout_name = template_slide.slide_layout.name
-            matching_layout = None
-            for layout in output_prs.slide_layouts:
-                if layout.name == layout_name:
-                    matching_layout = layout
-                    break
+            template_layout = template_slide.slide_layout
+            layout_name = template_layout.name
+            matching_layout = layout_by_name.get(layout_name)
             
             if matching_layout is None:
                 # Fallback: try to use layout at same index, or blank layout
-                try:
-                    layout_idx = template_slide.slide_layout.element.getparent().index(template_slide.slide_layout.element)
-                    if layout_idx < len(output_prs.slide_layouts):
-                        matching_layout = output_prs.slide_layouts[layout_idx]
-                except:
-                    pass
+                layout_idx = template_layout_index.get(id(template_layout.element))
+                if layout_idx is not None and layout_idx < len(output_layouts):
+                    matching_layout = output_layouts[layout_idx]
                 
                 if matching_layout is None:
                     # Last resort: use first layout or blank
-                    matching_layout = output_prs.slide_layouts[0] if len(output_prs.slide_layouts) > 0 else None
+                    matching_layout = output_layouts[0] if output_layouts else None
             
             if matching_layout is None:
                 raise ValueError(f"Could not find matching layout for '{layout_name}'")
@@ -197,99 +272,62 @@ class PowerPointAdvancedGenerator(DocumentGenerator):
             # Add slide using the layout
             new_slide = output_prs.slides.add_slide(matching_layout)
             
-            # Copy all shapes from the template slide (images, custom shapes, etc.)
-            self._copy_slide_shapes(template_slide, new_slide)
-            
-            # Copy placeholder content from template (title, body, etc.)
-            self._copy_placeholder_content(template_slide, new_slide)
+            # Copy all shapes from the template slide (images, custom shapes,
+            # placeholder content such as title and body, etc.)
+            self._copy_slide_shapes(template_slide, new_slide, image_parts)
             
             # Now populate with data (this will replace placeholders)
             self._populate_slide(new_slide, build_info['fields'], build_info['metadata'])
         
         # Save the presentation
-        output_prs.save(output_path)
-        return output_path
-    
-    def _copy_placeholder_content(self, source_slide, target_slide):
-        """
-        Copy placeholder text content from source slide to target slide.
-        This ensures placeholders have their template content before we replace them.
-        """
-        for source_shape in source_slide.shapes:
-            # Only copy from placeholders with text
-            if hasattr(source_shape, 'is_placeholder') and source_shape.is_placeholder:
-                if not hasattr(source_shape, 'text_frame'):
-                    continue
-                
-                # Find the corresponding placeholder in target by index
-                try:
-                    source_idx = source_shape.placeholder_format.idx
-                    for target_shape in target_slide.placeholders:
-                        if target_shape.placeholder_format.idx == source_idx:
-                            # Copy text content from source to target
-                            if hasattr(target_shape, 'text_frame') and hasattr(source_shape, 'text_frame'):
-                                self._copy_text_frame_content(source_shape.text_frame, target_shape.text_frame)
-                            break
-                except:
-                    pass
+        return self._save(output_prs, output_path)
     
-    def _copy_slide_shapes(self, source_slide, target_slide):
+    def _copy_slide_shapes(self, source_slide, target_slide, image_parts: Optional[Dict[Any, Any]] = None):
         """
         Copy all shapes from source slide to target slide.
         This includes images, text boxes, and other custom content.
         Fills picture placeholders if they contain images.
-        Skips text placeholders since they come from the layout.
+        Copies the text of text placeholders into the matching placeholders
+        the layout gave the target, so they hold their template content
+        before we replace them.
+        
+        `image_parts` maps source image parts to the output image parts already
+        created for them; pass the same dict for every slide of one output.
         """
+        if image_parts is None:
+            image_parts = {}
+        
+        from pptx.dml.color import MSO_COLOR_TYPE
+        from pptx.enum.dml import MSO_FILL
         from pptx.enum.shapes import MSO_SHAPE_TYPE
+        from pptx.shapes.placeholder import PlaceholderPicture
         from pptx.util import Inches
-        import io
         
-        # First, identify picture placeholders in source that have images
-        # and fill corresponding placeholders in target
-        for source_shape in source_slide.shapes:
-            is_placeholder = hasattr(source_shape, 'is_placeholder') and source_shape.is_placeholder
-            
-            if is_placeholder and source_shape.shape_type == MSO_SHAPE_TYPE.PLACEHOLDER:
-                # Check if it's a picture placeholder with an image
-                try:
-                    if hasattr(source_shape, 'image'):
-                        source_image = source_shape.image
-                        
-                        # Find the corresponding placeholder in target by index
-                        source_idx = source_shape.placeholder_format.idx
-                        target_placeholder = None
-                        for target_shape in target_slide.placeholders:
-                            if target_shape.placeholder_format.idx == source_idx:
-                                target_placeholder = target_shape
-                                break
-                        
-                        if target_placeholder is not None:
-                            # Insert picture into the placeholder
-                            try:
-                                target_placeholder.insert_picture(io.BytesIO(source_image.blob))
-                            except:
-                                # If insert fails, add as separate picture
-                                target_slide.shapes.add_picture(
-                                    io.BytesIO(source_image.blob),
-                                    source_shape.left,
-                                    source_shape.top,
-                                    source_shape.width,
-                                    source_shape.height
-                                )
-                except:
-                    pass
+        # Index the target placeholders once rather than searching per source shape
+        target_by_idx = {shape.placeholder_format.idx: shape for shape in target_slide.placeholders}
         
-        # Now copy non-placeholder shapes
+        # A single pass over the source shapes handles placeholders and
+        # free-standing shapes alike
         for shape in source_slide.shapes:
-            # Skip all placeholders - we handled picture placeholders above
-            if hasattr(shape, 'is_placeholder') and shape.is_placeholder:
+            # Test capabilities with type checks and has_* properties; probing with
+            # hasattr() raises and discards an exception for every miss
+            if shape.is_placeholder:
+                if isinstance(shape, PlaceholderPicture):
+                    # Picture placeholder with an image
+                    self._copy_picture_placeholder(shape, target_slide, target_by_idx, image_parts)
+                elif shape.has_text_frame and shape.text_frame.text:
+                    # Text placeholder; an empty one has nothing to carry over
+                    target_shape = target_by_idx.get(shape.placeholder_format.idx)
+                    # Copy text content from source to target
+                    if target_shape is not None and target_shape.has_text_frame:
+                        self._copy_text_frame_content(shape.text_frame, target_shape.text_frame)
                 continue
             
             # Skip decorative auto shapes (rectangles, lines, etc.) that don't have text
             # These are often covering lines or used for spacing and theme colors don't transfer well
             if shape.shape_type == MSO_SHAPE_TYPE.AUTO_SHAPE:
                 # Skip unless it has text content
-                if not (hasattr(shape, 'text_frame') and shape.text_frame.text.strip()):
+                if not (shape.has_text_frame and shape.text_frame.text.strip()):
                     continue
             
             # Skip connector lines and other connector shapes (shape_type 9 = LINE, 10 = CONNECTOR)
@@ -300,19 +338,9 @@ class PowerPointAdvancedGenerator(DocumentGenerator):
             if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
                 # Copy picture
                 try:
-                    # Get the image from the source shape
-                    image = shape.image
-                    image_bytes = image.blob
-                    
                     # Add the image to the target slide at the same position
-                    picture = target_slide.shapes.add_picture(
-                        io.BytesIO(image_bytes),
-                        shape.left,
-                        shape.top,
-                        shape.width,
-                        shape.height
-                    )
-                except Exception as e:
+                    picture = self._add_picture(target_slide, shape, image_parts)
+                except _COPY_ERRORS:
                     # If image copy fails, skip it
                     pass
                     
@@ -326,16 +354,16 @@ class PowerPointAdvancedGenerator(DocumentGenerator):
                         shape.height
                     )
                     # Copy text and formatting
-                    if hasattr(shape, 'text_frame'):
-                        self._copy_text_frame_content(shape.text_frame, text_box.text_frame)
-                except:
+                    self._copy_text_frame_content(shape.text_frame, text_box.text_frame)
+                except _COPY_ERRORS:
                     pass
                     
             elif shape.shape_type == MSO_SHAPE_TYPE.AUTO_SHAPE or shape.shape_type == MSO_SHAPE_TYPE.GROUP:
                 # Copy auto shapes and grouped shapes
                 try:
                     # For auto shapes, try to duplicate with same properties
-                    if hasattr(shape, 'auto_shape_type'):
+                    # (groups have no auto shape type and are not copied)
+                    if shape.shape_type == MSO_SHAPE_TYPE.AUTO_SHAPE:
                         new_shape = target_slide.shapes.add_shape(
                             shape.auto_shape_type,
                             shape.left,
@@ -344,19 +372,96 @@ class PowerPointAdvancedGenerator(DocumentGenerator):
                             shape.height
                         )
                         # Copy fill and line properties if possible
-                        if hasattr(shape, 'fill') and hasattr(new_shape, 'fill'):
-                            try:
-                                if shape.fill.type == 1:  # Solid fill
-                                    new_shape.fill.solid()
-                                    new_shape.fill.fore_color.rgb = shape.fill.fore_color.rgb
-                            except:
-                                pass
+                        if shape.fill.type == MSO_FILL.SOLID:
+                            new_shape.fill.solid()
+                            # Theme colors have no RGB value to copy
+                            if shape.fill.fore_color.type == MSO_COLOR_TYPE.RGB:
+                                new_shape.fill.fore_color.rgb = shape.fill.fore_color.rgb
                         # Copy text if it has text
-                        if hasattr(shape, 'text_frame') and hasattr(new_shape, 'text_frame'):
-                            self._copy_text_frame_content(shape.text_frame, new_shape.text_frame)
-                except:
+                        self._copy_text_frame_content(shape.text_frame, new_shape.text_frame)
+                except _COPY_ERRORS:
                     pass
     
+    def _copy_picture_placeholder(self, source_shape, target_slide, target_by_idx: Dict[int, Any], image_parts: Dict[Any, Any]):
+        """
+        Fill the target placeholder matching a source picture placeholder with its image.
+        
+        Like _add_picture(), only the first copy of an image goes through
+        python-pptx's insert_picture(); later copies point the new placeholder
+        picture at the image part that created.
+        """
+        from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+        from pptx.oxml.shapes.picture import CT_Picture
+        import io
+        
+        try:
+            source_part = source_shape.part.related_part(source_shape._element.blip_rId)
+            
+            # Find the corresponding placeholder in target by index
+            target_placeholder = target_by_idx.get(source_shape.placeholder_format.idx)
+            
+            if target_placeholder is not None:
+                if not isinstance(target_placeholder, PicturePlaceholder):
+                    # Only picture placeholders take an image
+                    self._add_picture(target_slide, source_shape, image_parts)
+                    return
+                
+                # Insert picture into the placeholder
+                try:
+                    image_part = image_parts.get(source_part)
+                    if image_part is None:
+                        picture = target_placeholder.insert_picture(io.BytesIO(source_part.blob))
+                        image_parts[source_part] = target_slide.part.related_part(picture._element.blip_rId)
+                    else:
+                        rId = target_slide.part.relate_to(image_part, RT.IMAGE)
+                        pic = CT_Picture.new_ph_pic(
+                            target_placeholder.shape_id, target_placeholder.name, image_part.desc, rId
+                        )
+                        pic.crop_to_fit(image_part._px_size, (target_placeholder.width, target_placeholder.height))
+                        target_placeholder._replace_placeholder_with(pic)
+                except _COPY_ERRORS:
+                    # If insert fails, add as separate picture
+                    self._add_picture(target_slide, source_shape, image_parts)
+        except _COPY_ERRORS:
+            pass
+    
+    def _add_picture(self, target_slide, source_picture, image_parts: Dict[Any, Any]):
+        """
+        Add a copy of `source_picture` to `target_slide` at the same position and size.
+        
+        The first copy of an image goes through add_picture(); later copies relate
+        the slide to the image part created then, skipping the blob read, hash
+        and package-wide part lookup add_picture() would repeat.
+        """
+        from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+        import io
+        
+        source_part = source_picture.part.related_part(source_picture._element.blip_rId)
+        image_part = image_parts.get(source_part)
+        if image_part is None:
+            picture = target_slide.shapes.add_picture(
+                io.BytesIO(source_part.blob),
+                source_picture.left,
+                source_picture.top,
+                source_picture.width,
+                source_picture.height
+            )
+            image_parts[source_part] = target_slide.part.related_part(picture._element.blip_rId)
+            return picture
+        
+        rId = target_slide.part.relate_to(image_part, RT.IMAGE)
+        shapes = target_slide.shapes
+        pic = shapes._add_pic_from_image_part(
+            image_part,
+            rId,
+            source_picture.left,
+            source_picture.top,
+            source_picture.width,
+            source_picture.height
+        )
+        shapes._recalculate_extents()
+        return shapes._shape_factory(pic)
+    
     def _copy_text_frame_content(self, source_frame, target_frame):
         """Copy text content and basic formatting from source to target text frame."""
         try:
@@ -369,11 +474,11 @@ class PowerPointAdvancedGenerator(DocumentGenerator):
                 # Copy alignment if set
                 if source_para.alignment is not None:
                     target_para.alignment = source_para.alignment
-        except:
+        except _COPY_ERRORS:
             # If copying fails, just set the plain text
             try:
                 target_frame.text = source_frame.text
-            except:
+            except _COPY_ERRORS:
                 pass
     
     def _populate_slide(self, slide, fields: Dict[str, Any], metadata: Optional[Dict[str, Any]]):
@@ -382,70 +487,140 @@ class PowerPointAdvancedGenerator(DocumentGenerator):
         """
         placeholders_info = metadata.get("placeholders", {}) if metadata else {}
         
-        # First pass: handle simple text replacements
+        # Probe each shape's capabilities once for all the field handlers below
+        shapes = self._classify_shapes(slide)
+        
+        # Simple text fields are collected and replaced together in one walk
+        # of the slide; the other types each need their own handling
+        replacements = {}
         for field_name, field_value in fields.items():
             placeholder_info = placeholders_info.get(field_name, {})
             field_type = placeholder_info.get("type", "text")
             
             if field_type in ["text", "paragraph", "number", "date"]:
                 # Simple replacement
-                placeholder = f"{{{{{field_name}}}}}"
-                self._replace_text_in_slide(slide, placeholder, str(field_value))
+                replacements[f"{{{{{field_name}}}}}"] = str(field_value)
             
             elif field_type == "list":
                 # Handle bullet points
-                self._populate_list_field(slide, field_name, field_value)
+                self._populate_list_field(shapes, field_name, field_value)
             
             elif field_type == "table":
                 # Handle table data
-                self._populate_table_field(slide, field_name, field_value)
+                self._populate_table_field(shapes, field_name, field_value)
             
             elif field_type == "image":
                 # Handle image insertion
                 self._populate_image_field(slide, field_name, field_value)
+        
+        if replacements:
+            self._replace_all_text_in_slide(shapes, replacements)
     
-    def _replace_text_in_slide(self, slide, placeholder: str, value: str):
-        """Replace placeholder text in all text elements of a slide."""
-        for shape in slide.shapes:
-            if hasattr(shape, "text_frame"):
-                # First, try direct replacement
-                text_frame = shape.text_frame
-                
-                # Collect all runs in order
-                all_text = shape.text
-                if placeholder in all_text:
-                    # Replace in the text frame
-                    # Since PowerPoint might split the text across runs,
-                    # we need to rebuild the text
-                    new_text = all_text.replace(placeholder, value)
-                    
-                    # Clear and rebuild
-                    text_frame.clear()
-                    p = text_frame.paragraphs[0]
-                    p.text = new_text
+    def _classify_shapes(self, slide) -> List[Tuple[Any, bool, bool]]:
+        """
+        List a slide's shapes as (shape, has_text_frame, has_table) tuples.
+        
+        Uses python-pptx's cheap has_* properties instead of probing with
+        hasattr(), which raises (and builds a traceback) for every shape
+        lacking the attribute.
+        """
+        return [(shape, shape.has_text_frame, shape.has_table) for shape in slide.shapes]
+    
+    def _replace_all_text_in_slide(self, shapes: List[Tuple[Any, bool, bool]], replacements: Dict[str, str]):
+        """Replace every placeholder in `replacements` in a single pass over the classified shapes of a slide."""
+        pattern = _placeholder_pattern(frozenset(replacements))
+        replace = lambda m: replacements[m.group(0)]
+        
+        for shape, has_text_frame, has_table in shapes:
+            if has_text_frame:
+                self._replace_in_text_frame(shape.text_frame, pattern, replace)
             
             # Handle tables
-            if hasattr(shape, "table"):
+            if has_table:
                 table = shape.table
                 for row in table.rows:
                     for cell in row.cells:
                         if hasattr(cell, "text_frame"):
-                            cell_text = cell.text
-                            if placeholder in cell_text:
-                                new_text = cell_text.replace(placeholder, value)
-                                cell.text_frame.clear()
-                                p = cell.text_frame.paragraphs[0]
-                                p.text = new_text
+                            self._replace_in_text_frame(cell.text_frame, pattern, replace)
+    
+    def _replace_in_text_frame(self, text_frame, pattern, replace):
+        """
+        Apply `pattern.sub(replace, ...)` to a text frame, editing runs in place.
+        
+        Placeholders inside a single run are replaced there, keeping the run's
+        formatting. A paragraph with a placeholder PowerPoint split across runs
+        is merged into its first run and substituted once as a whole.
+        """
+        for paragraph in text_frame.paragraphs:
+            runs = paragraph.runs
+            # Every placeholder starts with "{{" and most paragraphs hold none,
+            # so the joined text lets them be skipped
+            texts = [run.text for run in runs]
+            text = "".join(texts)
+            if "{{" not in text:
+                continue
+            
+            # A match starting and ending in the same run can be replaced there
+            run_ends = list(accumulate(map(len, texts)))
+            if all(
+                bisect_right(run_ends, match.start()) == bisect_left(run_ends, match.end())
+                for match in pattern.finditer(text)
+            ):
+                self._replace_in_runs(runs, pattern, replace)
+            else:
+                self._merge_and_replace(paragraph, runs[0], pattern, replace)
     
-    def _populate_list_field(self, slide, field_name: str, items: List[str]):
+    def _merge_and_replace(self, paragraph, first_run, pattern, replace):
+        """Fold a paragraph's runs and line breaks into its first run, then substitute the whole text."""
+        r_tag, br_tag = qn("a:r"), qn("a:br")
+        first_r = first_run._r
+        parts = []
+        for child in list(paragraph._p):
+            if child.tag == r_tag:
+                parts.append(child.text or "")
+            elif child.tag == br_tag:
+                parts.append("\v")
+            else:
+                continue
+            if child is not first_r:
+                paragraph._p.remove(child)
+        self._set_run_text(first_run, pattern.sub(replace, "".join(parts)))
+    
+    def _set_run_text(self, run, text: str):
+        """
+        Set a run's text, turning line breaks into <a:br/> elements.
+        
+        Assigning run.text would store a raw newline that PowerPoint doesn't
+        render. Each further line goes into a copy of the run, so it keeps the
+        run's formatting, just as paragraph-level assignment breaks lines.
+        """
+        if "\n" not in text and "\v" not in text:
+            run.text = text
+            return
+        
+        lines = _LINE_BREAK_RE.split(text)
+        run.text = lines[0]
+        r = run._r
+        for line in lines[1:]:
+            br = r.makeelement(qn("a:br"), {})
+            rPr = r.find(qn("a:rPr"))
+            if rPr is not None:
+                br.append(deepcopy(rPr))
+            new_r = deepcopy(r)
+            new_r.text = line
+            r.addnext(br)
+            br.addnext(new_r)
+            r = new_r
+    
+    def _populate_list_field(self, shapes: List[Tuple[Any, bool, bool]], field_name: str, items: List[str]):
         """
         Populate a bullet point list field.
         Finds a shape containing {{field_name}} and replaces it with bullet points.
         """
         placeholder = f"{{{{{field_name}}}}}"
         
-        for shape in slide.shapes:
-            if hasattr(shape, "text_frame"):
+        for shape, has_text_frame, _ in shapes:
+            if has_text_frame:
                 # Check if this shape contains the placeholder
                 if placeholder in shape.text:
                     text_frame = shape.text_frame
@@ -463,42 +638,52 @@ class PowerPointAdvancedGenerator(DocumentGenerator):
                     
                     return
     
-    def _populate_table_field(self, slide, field_name: str, table_data: List[List[Any]]):
+    def _populate_table_field(self, shapes: List[Tuple[Any, bool, bool]], field_name: str, table_data: List[List[Any]]):
         """
         Populate a table field with data.
         Expects table_data as a 2D array: [[row1_col1, row1_col2], [row2_col1, row2_col2], ...]
         """
         placeholder = f"{{{{{field_name}}}}}"
         
-        for shape in slide.shapes:
-            if hasattr(shape, "table"):
+        for shape, _, has_table in shapes:
+            if has_table:
                 table = shape.table
                 
-                # Check if table contains the placeholder
-                has_placeholder = False
-                for row in table.rows:
-                    for cell in row.cells:
-                        if placeholder in cell.text:
-                            has_placeholder = True
-                            break
-                    if has_placeholder:
-                        break
+                # Find the cells holding the placeholder in a single scan
+                placeholder_cells = [
+                    (row_idx, col_idx, cell)
+                    for row_idx, row in enumerate(table.rows)
+                    for col_idx, cell in enumerate(row.cells)
+                    if placeholder in cell.text
+                ]
                 
-                if has_placeholder and table_data:
-                    # Clear placeholder
-                    for row in table.rows:
-                        for cell in row.cells:
-                            cell.text = cell.text.replace(placeholder, "")
-                    
+                if placeholder_cells and table_data:
                     # Populate table with data
+                    rows = table.rows
                     for row_idx, row_data in enumerate(table_data):
-                        if row_idx < len(table.rows):
+                        if row_idx < len(rows):
+                            cells = rows[row_idx].cells
                             for col_idx, cell_value in enumerate(row_data):
-                                if col_idx < len(table.rows[row_idx].cells):
-                                    table.rows[row_idx].cells[col_idx].text = str(cell_value)
+                                if col_idx < len(cells):
+                                    self._set_cell_text(cells[col_idx], str(cell_value))
+                    
+                    # Clear the placeholder from cells the data didn't overwrite
+                    for row_idx, col_idx, cell in placeholder_cells:
+                        if row_idx >= len(table_data) or col_idx >= len(table_data[row_idx]):
+                            cell.text = cell.text.replace(placeholder, "")
                     
                     return
     
+    def _set_cell_text(self, cell, value: str):
+        """Set a table cell's text, keeping the run formatting when the cell has a single run."""
+        paragraphs = cell.text_frame.paragraphs
+        if len(paragraphs) == 1:
+            runs = paragraphs[0].runs
+            if len(runs) == 1:
+                self._set_run_text(runs[0], value)
+                return
+        cell.text = value
+    
     def _populate_image_field(self, slide, field_name: str, image_path: str):
         """
         Replace a placeholder with an image.
@@ -519,29 +704,22 @@ class PowerPointAdvancedGenerator(DocumentGenerator):
         """
         return self.get_template_slide_types(template_path)
     
-    def get_template_fields(self, template_path: Path) -> list[str]:
-        """
-        Get all unique field names from the template.
-        Required by base class.
-        """
-        prs = Presentation(template_path)
+    def _extract_fields(self, template: BytesIO) -> Tuple[str, ...]:
+        """Extract the sorted placeholder names from an advanced PowerPoint template."""
+        prs = Presentation(template)
         fields = set()
-        pattern = r'\{\{([^}]+)\}\}'
         
+        # Work on the slide XML directly instead of building python-pptx shape,
+        # paragraph and run proxies. Runs are joined per paragraph so placeholders
+        # PowerPoint split across runs are still found.
         for slide in prs.slides:
-            for shape in slide.shapes:
-                if hasattr(shape, "text_frame") and shape.text:
-                    matches = re.findall(pattern, shape.text)
-                    fields.update(matches)
-                
-                if hasattr(shape, "table"):
-                    table = shape.table
-                    for row in table.rows:
-                        for cell in row.cells:
-                            matches = re.findall(pattern, cell.text)
-                            fields.update(matches)
-        
-        return sorted(list(fields))
+            for paragraph in _TEXT_PARAGRAPHS_XPATH(slide._element):
+                text = "".join(_RUN_TEXT_XPATH(paragraph))
+                # Most paragraphs carry no placeholder; skip the regex for them
+                if "{{" in text:
+                    fields.update(_PLACEHOLDER_RE.findall(text))
+        
+        return tuple(sorted(fields))
     
     # Keep the original generate method for backward compatibility
     def generate(self, template_path: Path, fields: Dict[str, Any], output_path: Path) -> Path:
@@ -549,14 +727,14 @@ class PowerPointAdvancedGenerator(DocumentGenerator):
         Original generate method - replaces all placeholders in entire template.
         Use generate_from_slides() for advanced slide composition.
         """
-        prs = Presentation(template_path)
+        prs = Presentation(self._open_template(self._template_key(template_path)))
         
-        for slide in prs.slides:
-            self._replace_text_in_slide(slide, "{{", "}}")
-            # Simple replacement for all fields
-            for field_name, field_value in fields.items():
-                placeholder = f"{{{{{field_name}}}}}"
-                self._replace_text_in_slide(slide, placeholder, str(field_value))
-        
-        prs.save(output_path)
-        return output_path
+        # Placeholder strings and values are built once, not per slide
+        replacements = self._compile_replacements(fields)
+        
+        if replacements:
+            for slide in prs.slides:
+                # Simple replacement for all fields, in one pass over the slide
+                self._replace_all_text_in_slide(self._classify_shapes(slide), replacements)
+        
+        return self._save(prs, output_path)
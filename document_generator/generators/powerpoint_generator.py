@@ -1,12 +1,16 @@
 """PowerPoint document generator using python-pptx."""
 
+from io import BytesIO
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 import re
 from pptx import Presentation
 from .base import DocumentGenerator
 
 
+# Placeholders in format {{field_name}}
+_PLACEHOLDER_RE = re.compile(r'\{\{([^}]+)\}\}')
+
 class PowerPointGenerator(DocumentGenerator):
     """Generator for Microsoft PowerPoint documents."""
     
@@ -16,54 +20,50 @@ class PowerPointGenerator(DocumentGenerator):
         
         Placeholders in the template should be in the format {{field_name}}.
         """
-        # Load the template
-        prs = Presentation(template_path)
+        prs = Presentation(self._open_template(self._template_key(template_path)))
+        
+        # Unknown placeholders are left untouched
+        replacements = self._compile_replacements(fields)
+        replace = lambda m: replacements.get(m.group(0), m.group(0))
         
         # Iterate through all slides
         for slide in prs.slides:
             # Replace in shapes
             for shape in slide.shapes:
                 if hasattr(shape, "text_frame"):
-                    self._replace_text_in_shape(shape, fields)
+                    self._replace_text_in_shape(shape, replace)
                 # Replace in tables
                 if hasattr(shape, "table"):
                     table = shape.table
                     for row in table.rows:
                         for cell in row.cells:
-                            self._replace_text_in_shape(cell, fields)
+                            self._replace_text_in_shape(cell, replace)
         
         # Save the presentation
-        prs.save(output_path)
-        return output_path
+        return self._save(prs, output_path)
     
-    def _replace_text_in_shape(self, shape, fields: Dict[str, Any]) -> None:
+    def _replace_text_in_shape(self, shape, replace) -> None:
         """Replace placeholder text in a shape."""
         if not hasattr(shape, "text_frame"):
             return
-            
+        
         text_frame = shape.text_frame
         for paragraph in text_frame.paragraphs:
-            for run in paragraph.runs:
-                for field_name, field_value in fields.items():
-                    placeholder = f"{{{{{field_name}}}}}"
-                    if placeholder in run.text:
-                        run.text = run.text.replace(placeholder, str(field_value))
+            self._replace_in_runs(paragraph.runs, _PLACEHOLDER_RE, replace)
     
-    def get_template_fields(self, template_path: Path) -> list[str]:
-        """Extract field names from a PowerPoint template."""
-        prs = Presentation(template_path)
+    def _extract_fields(self, template: BytesIO) -> Tuple[str, ...]:
+        """Extract the sorted placeholder names from a PowerPoint template."""
+        prs = Presentation(template)
         fields = set()
         
-        # Find placeholders in format {{field_name}}
-        pattern = r'\{\{([^}]+)\}\}'
-        
         # Search in all slides
         for slide in prs.slides:
             for shape in slide.shapes:
                 if hasattr(shape, "text_frame"):
                     text = shape.text
-                    matches = re.findall(pattern, text)
-                    fields.update(matches)
+                    # Most shapes carry no placeholder; skip the regex for them
+                    if "{{" in text:
+                        fields.update(_PLACEHOLDER_RE.findall(text))
                 # Search in tables
                 if hasattr(shape, "table"):
                     table = shape.table
@@ -71,7 +71,7 @@ class PowerPointGenerator(DocumentGenerator):
                         for cell in row.cells:
                             if hasattr(cell, "text_frame"):
                                 text = cell.text
-                                matches = re.findall(pattern, text)
-                                fields.update(matches)
+                                if "{{" in text:
+                                    fields.update(_PLACEHOLDER_RE.findall(text))
         
-        return sorted(list(fields))
+        return tuple(sorted(fields))
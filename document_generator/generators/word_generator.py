@@ -1,10 +1,44 @@
 """Word document generator using python-docx."""
 
+from io import BytesIO
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, Tuple
+import html
 import re
+import zipfile
 from docx import Document
-from .base import DocumentGenerator
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.oxml.ns import qn
+from docx.text.paragraph import Paragraph
+from .base import DocumentGenerator, _placeholder_pattern
+
+
+# Raw XML scanning used by get_template_fields(): the archive members holding
+# document text, and the text of each <w:t> run element
+_TEXT_PART_RE = re.compile(r'word/(document|header\d*|footer\d*)\.xml$')
+_XML_RUN_TEXT_RE = re.compile(rb'<w:t(?:\s[^>]*)?>([^<]*)</w:t>')
+_XML_PLACEHOLDER_RE = re.compile(rb'\{\{([^}]+)\}\}')
+
+# Relationships from the main document to its header and footer parts
+_HEADER_FOOTER_RELTYPES = frozenset((RT.HEADER, RT.FOOTER))
+
+def _iter_paragraphs(doc) -> Iterator[Any]:
+    """
+    Yield every paragraph placeholders are looked for in.
+    
+    Covers the same parts get_template_fields() scans: the whole body,
+    including nested tables and text boxes, and every header and footer part
+    (first-page and even-page ones too).
+    """
+    # Body paragraphs, wherever they are nested
+    for p in doc.element.body.iter(qn("w:p")):
+        yield Paragraph(p, doc)
+    
+    # Headers and footers; each part once, however many sections link to it
+    for rel in doc.part.rels.values():
+        if rel.reltype in _HEADER_FOOTER_RELTYPES and not rel.is_external:
+            for p in rel.target_part.element.iter(qn("w:p")):
+                yield Paragraph(p, doc)
 
 
 class WordGenerator(DocumentGenerator):
@@ -16,74 +50,54 @@ class WordGenerator(DocumentGenerator):
         
         Placeholders in the template should be in the format {{field_name}}.
         """
-        # Load the template
-        doc = Document(template_path)
+        doc = Document(self._open_template(self._template_key(template_path)))
         
-        # Replace placeholders in paragraphs
-        for paragraph in doc.paragraphs:
-            self._replace_text_in_paragraph(paragraph, fields)
+        replacements = self._compile_replacements(fields)
+        if not replacements:
+            # Nothing to substitute; an empty alternation would match everywhere
+            return self._save(doc, output_path)
         
-        # Replace placeholders in tables
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    for paragraph in cell.paragraphs:
-                        self._replace_text_in_paragraph(paragraph, fields)
+        # One alternation of every placeholder, so each run is scanned once for all fields
+        pattern = _placeholder_pattern(frozenset(replacements))
+        replace = lambda m: replacements[m.group(0)]
         
-        # Replace placeholders in headers and footers
-        for section in doc.sections:
-            # Header
-            header = section.header
-            for paragraph in header.paragraphs:
-                self._replace_text_in_paragraph(paragraph, fields)
-            
-            # Footer
-            footer = section.footer
-            for paragraph in footer.paragraphs:
-                self._replace_text_in_paragraph(paragraph, fields)
+        # Replace placeholders in the body, tables, text boxes, headers and footers
+        for paragraph in _iter_paragraphs(doc):
+            self._replace_text_in_paragraph(paragraph, pattern, replace)
         
         # Save the document
-        doc.save(output_path)
-        return output_path
+        return self._save(doc, output_path)
     
-    def _replace_text_in_paragraph(self, paragraph, fields: Dict[str, Any]) -> None:
+    def _replace_text_in_paragraph(self, paragraph, pattern: re.Pattern, replace) -> None:
         """Replace placeholder text in a paragraph."""
-        for field_name, field_value in fields.items():
-            placeholder = f"{{{{{field_name}}}}}"
-            if placeholder in paragraph.text:
-                # Replace in runs to preserve formatting
-                for run in paragraph.runs:
-                    if placeholder in run.text:
-                        run.text = run.text.replace(placeholder, str(field_value))
-    
-    def get_template_fields(self, template_path: Path) -> list[str]:
-        """Extract field names from a Word template."""
-        doc = Document(template_path)
-        fields = set()
-        
-        # Find placeholders in format {{field_name}}
-        pattern = r'\{\{([^}]+)\}\}'
+        # Most paragraphs hold no placeholder; skip them before touching the runs
+        if "{{" not in paragraph.text:
+            return
         
-        # Search in paragraphs
-        for paragraph in doc.paragraphs:
-            matches = re.findall(pattern, paragraph.text)
-            fields.update(matches)
+        self._replace_in_runs(paragraph.runs, pattern, replace)
+    
+    def _extract_fields(self, template: BytesIO) -> Tuple[str, ...]:
+        """
+        Extract the sorted placeholder names from a Word template.
         
-        # Search in tables
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    for paragraph in cell.paragraphs:
-                        matches = re.findall(pattern, paragraph.text)
-                        fields.update(matches)
+        Scans the raw XML of the main document, headers and footers instead of
+        loading the document through python-docx. The text of a paragraph's runs
+        is joined first, so placeholders split across runs still match.
+        """
+        fields = set()
         
-        # Search in headers and footers
-        for section in doc.sections:
-            for paragraph in section.header.paragraphs:
-                matches = re.findall(pattern, paragraph.text)
-                fields.update(matches)
-            for paragraph in section.footer.paragraphs:
-                matches = re.findall(pattern, paragraph.text)
-                fields.update(matches)
+        with zipfile.ZipFile(template) as archive:
+            for name in archive.namelist():
+                if not _TEXT_PART_RE.match(name):
+                    continue
+                data = archive.read(name)
+                if b"{" not in data:
+                    continue
+                for paragraph in data.split(b"</w:p>"):
+                    text = b"".join(_XML_RUN_TEXT_RE.findall(paragraph))
+                    # Most paragraphs carry no placeholder; skip the regex for them
+                    if b"{{" in text:
+                        for match in _XML_PLACEHOLDER_RE.findall(text):
+                            fields.add(html.unescape(match.decode("utf-8")))
         
-        return sorted(list(fields))
+        return tuple(sorted(fields))
@@ -1,237 +1,129 @@
 """Create an example PowerPoint template with metadata in slide notes."""
 
 import json
+from functools import lru_cache, partial
+from io import BytesIO
+import os
+import pptx
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pathlib import Path
 
 
+# Notes metadata is machine-read, so it is written as compact JSON; non-ASCII
+# text is kept as is rather than escaped
+_DUMP = partial(json.dumps, separators=(",", ":"), ensure_ascii=False)
+
+# Slide size, converted to EMUs once at import like the box geometry below
+SLIDE_WIDTH = Inches(10)
+SLIDE_HEIGHT = Inches(7.5)
+
+# Slide layouts, one entry per slide:
+#   (slide_type, description, boxes)
+# and one entry per text box:
+#   (field, field_type, field_description, left, top, width, height, font_size, bold, word_wrap)
+# The notes metadata is built from the same boxes, so the two can't drift apart.
+SLIDE_SPECS = (
+    ("title_page", "Main title slide for presentation opening", (
+        ("title", "text", "Main presentation title",
+         Inches(1), Inches(2.5), Inches(8), Inches(1), Pt(44), True, False),
+        ("subtitle", "text", "Presentation subtitle or date",
+         Inches(1), Inches(3.5), Inches(8), Inches(0.5), Pt(24), False, False),
+        ("presenter", "text", "Presenter name",
+         Inches(1), Inches(4.5), Inches(8), Inches(0.5), Pt(18), False, False),
+    )),
+    ("section_break", "Section divider slide", (
+        ("section_title", "text", "Section heading",
+         Inches(1), Inches(3), Inches(8), Inches(1.5), Pt(54), True, False),
+    )),
+    ("content", "Standard content slide with heading and body", (
+        ("heading", "text", "Slide heading",
+         Inches(1), Inches(0.5), Inches(8), Inches(0.75), Pt(36), True, False),
+        ("body", "paragraph", "Main content text",
+         Inches(1), Inches(1.5), Inches(8), Inches(2), Pt(18), False, True),
+        ("bullet_points", "list", "List of key points (array of strings)",
+         Inches(1.5), Inches(4), Inches(7), Inches(2.5), Pt(16), False, False),
+    )),
+    ("two_column", "Two column layout for comparisons or parallel content", (
+        ("heading", "text", "Slide heading",
+         Inches(1), Inches(0.5), Inches(8), Inches(0.75), Pt(36), True, False),
+        ("left_heading", "text", "Left column heading",
+         Inches(0.5), Inches(1.5), Inches(4), Inches(0.5), Pt(24), True, False),
+        ("left_content", "paragraph", "Left column content",
+         Inches(0.5), Inches(2.5), Inches(4), Inches(4), Pt(16), False, True),
+        ("right_heading", "text", "Right column heading",
+         Inches(5.5), Inches(1.5), Inches(4), Inches(0.5), Pt(24), True, False),
+        ("right_content", "paragraph", "Right column content",
+         Inches(5.5), Inches(2.5), Inches(4), Inches(4), Pt(16), False, True),
+    )),
+    ("closing", "Closing slide with message and contact information", (
+        ("closing_message", "text", "Closing message or call to action",
+         Inches(1), Inches(2.5), Inches(8), Inches(2), Pt(36), False, False),
+        ("contact_info", "text", "Contact information",
+         Inches(1), Inches(5), Inches(8), Inches(1), Pt(18), False, False),
+    )),
+)
+
+
+@lru_cache(maxsize=1)
+def _default_pptx_bytes():
+    """Bytes of the default.pptx shipped with python-pptx, cached for repeated builds."""
+    return (Path(pptx.__file__).parent / "templates" / "default.pptx").read_bytes()
+
+
+def _add_box(slide, box):
+    """Add one placeholder text box to a slide."""
+    field, _, _, left, top, width, height, font_size, bold, word_wrap = box
+    
+    text_frame = slide.shapes.add_textbox(left, top, width, height).text_frame
+    # A new text box holds a single empty paragraph; fill it directly rather
+    # than through text_frame.text, which clears and re-fetches the paragraphs
+    paragraph = text_frame.paragraphs[0]
+    paragraph.text = f"{{{{{field}}}}}"
+    font = paragraph.font
+    font.size = font_size
+    if bold:
+        font.bold = True
+    if word_wrap:
+        text_frame.word_wrap = True
+
+
 def create_advanced_presentation_template():
     """Create a PowerPoint template with metadata-driven slide layouts."""
-    prs = Presentation()
-    prs.slide_width = Inches(10)
-    prs.slide_height = Inches(7.5)
+    # Same blank deck as Presentation(), without re-reading it from disk
+    prs = Presentation(BytesIO(_default_pptx_bytes()))
+    prs.slide_width = SLIDE_WIDTH
+    prs.slide_height = SLIDE_HEIGHT
     
-    # Slide 1: Title Page
     blank_layout = prs.slide_layouts[6]  # Blank layout
-    slide = prs.slides.add_slide(blank_layout)
-    
-    # Add title
-    left = Inches(1)
-    top = Inches(2.5)
-    width = Inches(8)
-    height = Inches(1)
-    
-    title_box = slide.shapes.add_textbox(left, top, width, height)
-    title_frame = title_box.text_frame
-    title_frame.text = "{{title}}"
-    title_frame.paragraphs[0].font.size = Pt(44)
-    title_frame.paragraphs[0].font.bold = True
-    
-    # Add subtitle
-    subtitle_box = slide.shapes.add_textbox(left, Inches(3.5), width, Inches(0.5))
-    subtitle_frame = subtitle_box.text_frame
-    subtitle_frame.text = "{{subtitle}}"
-    subtitle_frame.paragraphs[0].font.size = Pt(24)
-    
-    # Add presenter
-    presenter_box = slide.shapes.add_textbox(left, Inches(4.5), width, Inches(0.5))
-    presenter_frame = presenter_box.text_frame
-    presenter_frame.text = "{{presenter}}"
-    presenter_frame.paragraphs[0].font.size = Pt(18)
-    
-    # Add metadata to notes
-    notes_slide = slide.notes_slide
-    notes_text_frame = notes_slide.notes_text_frame
-    metadata = {
-        "slide_type": "title_page",
-        "description": "Main title slide for presentation opening",
-        "placeholders": {
-            "title": {
-                "type": "text",
-                "description": "Main presentation title"
-            },
-            "subtitle": {
-                "type": "text",
-                "description": "Presentation subtitle or date"
-            },
-            "presenter": {
-                "type": "text",
-                "description": "Presenter name"
-            }
-        }
-    }
-    notes_text_frame.text = json.dumps(metadata, indent=2)
-    
-    # Slide 2: Section Break
-    slide = prs.slides.add_slide(blank_layout)
-    
-    section_box = slide.shapes.add_textbox(Inches(1), Inches(3), Inches(8), Inches(1.5))
-    section_frame = section_box.text_frame
-    section_frame.text = "{{section_title}}"
-    section_frame.paragraphs[0].font.size = Pt(54)
-    section_frame.paragraphs[0].font.bold = True
-    
-    notes_slide = slide.notes_slide
-    notes_text_frame = notes_slide.notes_text_frame
-    metadata = {
-        "slide_type": "section_break",
-        "description": "Section divider slide",
-        "placeholders": {
-            "section_title": {
-                "type": "text",
-                "description": "Section heading"
-            }
-        }
-    }
-    notes_text_frame.text = json.dumps(metadata, indent=2)
-    
-    # Slide 3: Content Slide
-    slide = prs.slides.add_slide(blank_layout)
-    
-    # Heading
-    heading_box = slide.shapes.add_textbox(Inches(1), Inches(0.5), Inches(8), Inches(0.75))
-    heading_frame = heading_box.text_frame
-    heading_frame.text = "{{heading}}"
-    heading_frame.paragraphs[0].font.size = Pt(36)
-    heading_frame.paragraphs[0].font.bold = True
-    
-    # Body text
-    body_box = slide.shapes.add_textbox(Inches(1), Inches(1.5), Inches(8), Inches(2))
-    body_frame = body_box.text_frame
-    body_frame.text = "{{body}}"
-    body_frame.paragraphs[0].font.size = Pt(18)
-    body_frame.word_wrap = True
-    
-    # Bullet points
-    bullets_box = slide.shapes.add_textbox(Inches(1.5), Inches(4), Inches(7), Inches(2.5))
-    bullets_frame = bullets_box.text_frame
-    bullets_frame.text = "{{bullet_points}}"
-    bullets_frame.paragraphs[0].font.size = Pt(16)
-    
-    notes_slide = slide.notes_slide
-    notes_text_frame = notes_slide.notes_text_frame
-    metadata = {
-        "slide_type": "content",
-        "description": "Standard content slide with heading and body",
-        "placeholders": {
-            "heading": {
-                "type": "text",
-                "description": "Slide heading"
-            },
-            "body": {
-                "type": "paragraph",
-                "description": "Main content text"
-            },
-            "bullet_points": {
-                "type": "list",
-                "description": "List of key points (array of strings)"
-            }
-        }
-    }
-    notes_text_frame.text = json.dumps(metadata, indent=2)
-    
-    # Slide 4: Two Column Layout
-    slide = prs.slides.add_slide(blank_layout)
-    
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(1), Inches(0.5), Inches(8), Inches(0.75))
-    title_frame = title_box.text_frame
-    title_frame.text = "{{heading}}"
-    title_frame.paragraphs[0].font.size = Pt(36)
-    title_frame.paragraphs[0].font.bold = True
-    
-    # Left column
-    left_heading_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(4), Inches(0.5))
-    left_heading_frame = left_heading_box.text_frame
-    left_heading_frame.text = "{{left_heading}}"
-    left_heading_frame.paragraphs[0].font.size = Pt(24)
-    left_heading_frame.paragraphs[0].font.bold = True
-    
-    left_body_box = slide.shapes.add_textbox(Inches(0.5), Inches(2.5), Inches(4), Inches(4))
-    left_body_frame = left_body_box.text_frame
-    left_body_frame.text = "{{left_content}}"
-    left_body_frame.paragraphs[0].font.size = Pt(16)
-    left_body_frame.word_wrap = True
-    
-    # Right column
-    right_heading_box = slide.shapes.add_textbox(Inches(5.5), Inches(1.5), Inches(4), Inches(0.5))
-    right_heading_frame = right_heading_box.text_frame
-    right_heading_frame.text = "{{right_heading}}"
-    right_heading_frame.paragraphs[0].font.size = Pt(24)
-    right_heading_frame.paragraphs[0].font.bold = True
-    
-    right_body_box = slide.shapes.add_textbox(Inches(5.5), Inches(2.5), Inches(4), Inches(4))
-    right_body_frame = right_body_box.text_frame
-    right_body_frame.text = "{{right_content}}"
-    right_body_frame.paragraphs[0].font.size = Pt(16)
-    right_body_frame.word_wrap = True
-    
-    notes_slide = slide.notes_slide
-    notes_text_frame = notes_slide.notes_text_frame
-    metadata = {
-        "slide_type": "two_column",
-        "description": "Two column layout for comparisons or parallel content",
-        "placeholders": {
-            "heading": {
-                "type": "text",
-                "description": "Slide heading"
-            },
-            "left_heading": {
-                "type": "text",
-                "description": "Left column heading"
-            },
-            "left_content": {
-                "type": "paragraph",
-                "description": "Left column content"
-            },
-            "right_heading": {
-                "type": "text",
-                "description": "Right column heading"
-            },
-            "right_content": {
-                "type": "paragraph",
-                "description": "Right column content"
-            }
-        }
-    }
-    notes_text_frame.text = json.dumps(metadata, indent=2)
-    
-    # Slide 5: Closing Slide
-    slide = prs.slides.add_slide(blank_layout)
-    
-    closing_box = slide.shapes.add_textbox(Inches(1), Inches(2.5), Inches(8), Inches(2))
-    closing_frame = closing_box.text_frame
-    closing_frame.text = "{{closing_message}}"
-    closing_frame.paragraphs[0].font.size = Pt(36)
-    
-    contact_box = slide.shapes.add_textbox(Inches(1), Inches(5), Inches(8), Inches(1))
-    contact_frame = contact_box.text_frame
-    contact_frame.text = "{{contact_info}}"
-    contact_frame.paragraphs[0].font.size = Pt(18)
     
-    notes_slide = slide.notes_slide
-    notes_text_frame = notes_slide.notes_text_frame
-    metadata = {
-        "slide_type": "closing",
-        "description": "Closing slide with message and contact information",
-        "placeholders": {
-            "closing_message": {
-                "type": "text",
-                "description": "Closing message or call to action"
-            },
-            "contact_info": {
-                "type": "text",
-                "description": "Contact information"
+    for slide_type, description, boxes in SLIDE_SPECS:
+        slide = prs.slides.add_slide(blank_layout)
+        for box in boxes:
+            _add_box(slide, box)
+        
+        # Add metadata to notes
+        metadata = {
+            "slide_type": slide_type,
+            "description": description,
+            "placeholders": {
+                field: {"type": field_type, "description": field_description}
+                for field, field_type, field_description, *_ in boxes
             }
         }
-    }
-    notes_text_frame.text = json.dumps(metadata, indent=2)
+        slide.notes_slide.notes_text_frame.text = _DUMP(metadata)
     
     # Save template
     template_path = Path('templates/advanced_presentation.pptx')
     template_path.parent.mkdir(parents=True, exist_ok=True)
-    prs.save(template_path)
+    # Serialize in memory, then write once and swap the file in, so a failed
+    # run never leaves a truncated template behind
+    buffer = BytesIO()
+    prs.save(buffer)
+    temp_path = template_path.with_name(template_path.name + '.tmp')
+    with open(temp_path, 'wb', buffering=0) as f:
+        f.write(buffer.getbuffer())
+    os.replace(temp_path, template_path)
     print(f"✅ Created advanced PowerPoint template: {template_path}")
     print("\nSlide types included:")
     print("  - title_page: Title, subtitle, presenter")
@@ -1,12 +1,50 @@
 """Script to create example templates for testing."""
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+import os
 from docx import Document
 from openpyxl import Workbook
+from openpyxl.styles import Color, Font
+import pptx
 from pptx import Presentation
-from pptx.util import Inches, Pt
+from pptx.util import Inches
 from pathlib import Path
 
 
+# Slide geometry, converted to EMUs once at import
+SLIDE_WIDTH = Inches(10)
+SLIDE_HEIGHT = Inches(7.5)
+SUMMARY_BOX = (Inches(1), Inches(1), Inches(8), Inches(1))  # left, top, width, height
+
+# Report fonts: the workbook's default font (Calibri 11) with overrides. Cells
+# share these instances instead of each copying and rewriting its own font.
+_DEFAULT_FONT_ATTRS = dict(name="Calibri", family=2, scheme="minor", color=Color(theme=1))
+TITLE_FONT = Font(size=14, bold=True, **_DEFAULT_FONT_ATTRS)
+BOLD_FONT = Font(size=11, bold=True, **_DEFAULT_FONT_ATTRS)
+
+
+def _save_atomically(document, template_path):
+    """
+    Save a document to template_path without ever leaving a partial file there.
+    
+    The zip is built in memory, written to a temporary file with one write()
+    and then moved over the target, so readers see the old template or the
+    complete new one.
+
+    The libraries' default deflate level is kept: for templates this small,
+    compression is only a fraction of a millisecond of the save, and
+    repacking the zip at a lower level would cost more than it saves.
+    """
+    buffer = BytesIO()
+    document.save(buffer)
+    temp_path = template_path.with_name(template_path.name + '.tmp')
+    with open(temp_path, 'wb', buffering=0) as f:
+        f.write(buffer.getbuffer())
+    os.replace(temp_path, template_path)
+
+
 def create_word_template():
     """Create an example Word template."""
     doc = Document()
@@ -48,7 +86,7 @@ def create_word_template():
     # Save template
     template_path = Path('templates/letter.docx')
     template_path.parent.mkdir(parents=True, exist_ok=True)
-    doc.save(template_path)
+    _save_atomically(doc, template_path)
     print(f"Created Word template: {template_path}")
 
 
@@ -58,32 +96,29 @@ def create_excel_template():
     ws = wb.active
     ws.title = "Report"
     
-    # Add headers
-    ws['A1'] = 'Monthly Report'
-    ws['A1'].font = ws['A1'].font.copy(bold=True, size=14)
-    
-    ws['A3'] = 'Report Date:'
-    ws['B3'] = '{{report_date}}'
-    
-    ws['A4'] = 'Department:'
-    ws['B4'] = '{{department}}'
-    
-    ws['A6'] = 'Metric'
-    ws['B6'] = 'Value'
-    ws['A6'].font = ws['A6'].font.copy(bold=True)
-    ws['B6'].font = ws['B6'].font.copy(bold=True)
-    
-    ws['A7'] = 'Total Sales'
-    ws['B7'] = '{{total_sales}}'
-    
-    ws['A8'] = 'New Customers'
-    ws['B8'] = '{{new_customers}}'
-    
-    ws['A9'] = 'Revenue'
-    ws['B9'] = '{{revenue}}'
-    
-    ws['A11'] = 'Notes:'
-    ws['A12'] = '{{notes}}'
+    # Write the sheet top to bottom with append(), one list per row
+    # (an empty list leaves a blank row)
+    rows = [
+        ['Monthly Report'],
+        [],
+        ['Report Date:', '{{report_date}}'],
+        ['Department:', '{{department}}'],
+        [],
+        ['Metric', 'Value'],
+        ['Total Sales', '{{total_sales}}'],
+        ['New Customers', '{{new_customers}}'],
+        ['Revenue', '{{revenue}}'],
+        [],
+        ['Notes:'],
+        ['{{notes}}'],
+    ]
+    for row in rows:
+        ws.append(row)
+    
+    # Header fonts
+    ws.cell(row=1, column=1).font = TITLE_FONT
+    ws.cell(row=6, column=1).font = BOLD_FONT
+    ws.cell(row=6, column=2).font = BOLD_FONT
     
     # Adjust column widths
     ws.column_dimensions['A'].width = 20
@@ -92,15 +127,22 @@ def create_excel_template():
     # Save template
     template_path = Path('templates/report.xlsx')
     template_path.parent.mkdir(parents=True, exist_ok=True)
-    wb.save(template_path)
+    _save_atomically(wb, template_path)
     print(f"Created Excel template: {template_path}")
 
 
+@lru_cache(maxsize=1)
+def _default_pptx_bytes():
+    """python-pptx's built-in blank deck, read from disk once per process."""
+    return (Path(pptx.__file__).parent / "templates" / "default.pptx").read_bytes()
+
+
 def create_powerpoint_template():
     """Create an example PowerPoint template."""
-    prs = Presentation()
-    prs.slide_width = Inches(10)
-    prs.slide_height = Inches(7.5)
+    # Parse the blank deck from memory; only the first call touches the disk
+    prs = Presentation(BytesIO(_default_pptx_bytes()))
+    prs.slide_width = SLIDE_WIDTH
+    prs.slide_height = SLIDE_HEIGHT
     
     # Slide 1: Title Slide
     title_slide_layout = prs.slide_layouts[0]
@@ -136,24 +178,25 @@ def create_powerpoint_template():
     blank_slide_layout = prs.slide_layouts[6]
     slide = prs.slides.add_slide(blank_slide_layout)
     
-    left = Inches(1)
-    top = Inches(1)
-    width = Inches(8)
-    height = Inches(1)
-    
-    txBox = slide.shapes.add_textbox(left, top, width, height)
+    txBox = slide.shapes.add_textbox(*SUMMARY_BOX)
     tf = txBox.text_frame
     tf.text = "Summary: {{summary}}"
     
     # Save template
     template_path = Path('templates/presentation.pptx')
     template_path.parent.mkdir(parents=True, exist_ok=True)
-    prs.save(template_path)
+    _save_atomically(prs, template_path)
     print(f"Created PowerPoint template: {template_path}")
 
 
+def _run(create_template):
+    """Call a template builder; module-level so worker processes can unpickle it."""
+    create_template()
+
+
 if __name__ == "__main__":
-    create_word_template()
-    create_excel_template()
-    create_powerpoint_template()
+    # The builders are independent and CPU-bound in XML serialization, which
+    # holds the GIL, so run them in separate processes
+    with ProcessPoolExecutor(max_workers=3) as executor:
+        list(executor.map(_run, [create_word_template, create_excel_template, create_powerpoint_template]))
     print("\nAll templates created successfully!")
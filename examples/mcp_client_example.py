@@ -5,105 +5,99 @@ generator MCP server.
 """
 
 import json
+import sys
 
 
-def example_mcp_requests():
-    """
-    Examples of MCP tool calls that can be sent to the document generator MCP server.
-    
-    Note: These are examples of the JSON payloads that would be sent via the MCP protocol.
-    In a real implementation, these would be sent through the MCP client library.
-    """
-    
-    print("Example MCP Tool Calls")
-    print("=" * 60)
-    
-    # Example 1: List all templates
-    list_templates_request = {
-        "name": "list_templates",
-        "arguments": {}
-    }
-    print("\n1. List Templates Request:")
-    print(json.dumps(list_templates_request, indent=2))
-    
-    # Example 2: Get specific template info
-    get_template_info_request = {
-        "name": "get_template_info",
-        "arguments": {
-            "template_name": "letter",
-            "document_type": "word"
-        }
+# Example 1: List all templates
+LIST_TEMPLATES_REQUEST = {
+    "name": "list_templates",
+    "arguments": {}
+}
+
+# Example 2: Get specific template info
+GET_TEMPLATE_INFO_REQUEST = {
+    "name": "get_template_info",
+    "arguments": {
+        "template_name": "letter",
+        "document_type": "word"
     }
-    print("\n2. Get Template Info Request:")
-    print(json.dumps(get_template_info_request, indent=2))
-    
-    # Example 3: Generate a Word document
-    generate_word_request = {
-        "name": "generate_document",
-        "arguments": {
-            "template_name": "letter",
-            "document_type": "word",
-            "fields": {
-                "date": "2024-01-15",
-                "recipient_name": "John Doe",
-                "body_text": "This letter was generated through the MCP server.",
-                "sender_name": "Jane Smith",
-                "sender_title": "Manager",
-                "company_name": "Acme Corporation",
-                "phone_number": "+1-555-0123"
-            },
-            "return_type": "download_link"
-        }
+}
+
+# Example 3: Generate a Word document
+GENERATE_WORD_REQUEST = {
+    "name": "generate_document",
+    "arguments": {
+        "template_name": "letter",
+        "document_type": "word",
+        "fields": {
+            "date": "2024-01-15",
+            "recipient_name": "John Doe",
+            "body_text": "This letter was generated through the MCP server.",
+            "sender_name": "Jane Smith",
+            "sender_title": "Manager",
+            "company_name": "Acme Corporation",
+            "phone_number": "+1-555-0123"
+        },
+        "return_type": "download_link"
     }
-    print("\n3. Generate Word Document Request:")
-    print(json.dumps(generate_word_request, indent=2))
-    
-    # Example 4: Generate an Excel document
-    generate_excel_request = {
-        "name": "generate_document",
-        "arguments": {
-            "template_name": "report",
-            "document_type": "excel",
-            "fields": {
-                "report_date": "2024-01-31",
-                "department": "Sales",
-                "total_sales": "150",
-                "new_customers": "25",
-                "revenue": "$75,000",
-                "notes": "Excellent performance this month."
-            },
-            "return_type": "download_link"
-        }
+}
+
+# Example 4: Generate an Excel document
+GENERATE_EXCEL_REQUEST = {
+    "name": "generate_document",
+    "arguments": {
+        "template_name": "report",
+        "document_type": "excel",
+        "fields": {
+            "report_date": "2024-01-31",
+            "department": "Sales",
+            "total_sales": "150",
+            "new_customers": "25",
+            "revenue": "$75,000",
+            "notes": "Excellent performance this month."
+        },
+        "return_type": "download_link"
     }
-    print("\n4. Generate Excel Document Request:")
-    print(json.dumps(generate_excel_request, indent=2))
-    
-    # Example 5: Generate a PowerPoint document
-    generate_ppt_request = {
-        "name": "generate_document",
-        "arguments": {
-            "template_name": "presentation",
-            "document_type": "powerpoint",
-            "fields": {
-                "presentation_title": "Q1 2024 Results",
-                "presenter_name": "Jane Smith",
-                "date": "January 31, 2024",
-                "slide_title": "Key Achievements",
-                "bullet_1": "Exceeded sales targets by 20%",
-                "bullet_2": "Acquired 25 new customers",
-                "bullet_3": "Launched 3 new products",
-                "summary": "Outstanding quarter with record performance."
-            },
-            "return_type": "download_link"
-        }
+}
+
+# Example 5: Generate a PowerPoint document
+GENERATE_PPT_REQUEST = {
+    "name": "generate_document",
+    "arguments": {
+        "template_name": "presentation",
+        "document_type": "powerpoint",
+        "fields": {
+            "presentation_title": "Q1 2024 Results",
+            "presenter_name": "Jane Smith",
+            "date": "January 31, 2024",
+            "slide_title": "Key Achievements",
+            "bullet_1": "Exceeded sales targets by 20%",
+            "bullet_2": "Acquired 25 new customers",
+            "bullet_3": "Launched 3 new products",
+            "summary": "Outstanding quarter with record performance."
+        },
+        "return_type": "download_link"
     }
-    print("\n5. Generate PowerPoint Document Request:")
-    print(json.dumps(generate_ppt_request, indent=2))
-    
-    print("\n" + "=" * 60)
-    print("\nHow to use with Claude Desktop or other MCP clients:")
-    print("\n1. Add this configuration to your MCP client settings:")
-    print("""
+}
+
+# (title, payload, payload rendered as JSON) for each example, serialized once at import
+EXAMPLE_REQUESTS = tuple(
+    (title, request, json.dumps(request, indent=2))
+    for title, request in (
+        ("1. List Templates Request:", LIST_TEMPLATES_REQUEST),
+        ("2. Get Template Info Request:", GET_TEMPLATE_INFO_REQUEST),
+        ("3. Generate Word Document Request:", GENERATE_WORD_REQUEST),
+        ("4. Generate Excel Document Request:", GENERATE_EXCEL_REQUEST),
+        ("5. Generate PowerPoint Document Request:", GENERATE_PPT_REQUEST),
+    )
+)
+
+
+_USAGE_NOTES = """
+How to use with Claude Desktop or other MCP clients:
+
+1. Add this configuration to your MCP client settings:
+
 {
   "mcpServers": {
     "document-generator": {
@@ -113,14 +107,38 @@ def example_mcp_requests():
     }
   }
 }
-""")
-    print("\n2. The MCP client will be able to use these tools:")
-    print("   - list_templates: List all available templates")
-    print("   - get_template_info: Get details about a specific template")
-    print("   - generate_document: Generate a document from a template")
+
+
+2. The MCP client will be able to use these tools:
+   - list_templates: List all available templates
+   - get_template_info: Get details about a specific template
+   - generate_document: Generate a document from a template
+
+3. AI agents can then use these tools to generate documents
+   based on user requests, automatically filling in fields."""
+
+
+def _render_examples() -> str:
+    """Render the example payloads and the usage notes as one block of text."""
+    parts = ["Example MCP Tool Calls", "=" * 60]
+    for title, _, request_json in EXAMPLE_REQUESTS:
+        parts.append(f"\n{title}")
+        parts.append(request_json)
+    parts.append("\n" + "=" * 60)
+    parts.append(_USAGE_NOTES)
+    return "\n".join(parts) + "\n"
+
+
+def example_mcp_requests():
+    """
+    Examples of MCP tool calls that can be sent to the document generator MCP server.
+    
+    Note: These are examples of the JSON payloads that would be sent via the MCP protocol.
+    In a real implementation, these would be sent through the MCP client library.
+    """
     
-    print("\n3. AI agents can then use these tools to generate documents")
-    print("   based on user requests, automatically filling in fields.")
+    # The whole guide is assembled first and written in one call
+    sys.stdout.write(_render_examples())
 
 
 if __name__ == "__main__":
@@ -1,22 +1,31 @@
-"""Example of using the advanced PowerPoint generator with metadata-driven slides."""
+"""Example of using the advanced PowerPoint generator with metadata-driven slides.
 
-import sys
-from pathlib import Path
+Run from the repository root with `python -m examples.use_advanced_generator`
+(or with the package installed).
+"""
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from collections import namedtuple
+from pathlib import Path
 
 from document_generator.generators.powerpoint_advanced_generator import PowerPointAdvancedGenerator
 
 
+# One generator for all examples; it caches the template and its parsed
+# slide metadata between calls
+generator = PowerPointAdvancedGenerator()
+TEMPLATE_PATH = Path("templates/advanced_presentation.pptx")
+
+# A slide specification: the slide type to use and the fields to fill in.
+# generate_from_slides() also accepts the equivalent dicts.
+Slide = namedtuple("Slide", "slide_type fields")
+
 def example_get_slide_types():
     """Example: Get available slide types from a template."""
     print("=" * 70)
     print("EXAMPLE 1: Get Slide Types from Template")
     print("=" * 70)
     
-    generator = PowerPointAdvancedGenerator()
-    template_path = Path("templates/advanced_presentation.pptx")
+    template_path = TEMPLATE_PATH
     
     slide_types = generator.get_template_slide_types(template_path)
     
@@ -40,77 +49,55 @@ def example_generate_presentation():
     print("EXAMPLE 2: Generate Presentation from Slides")
     print("=" * 70)
     
-    generator = PowerPointAdvancedGenerator()
-    template_path = Path("templates/advanced_presentation.pptx")
+    template_path = TEMPLATE_PATH
     output_path = Path("generated_documents/my_presentation.pptx")
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
     # Define the slides to include
-    slides_data = [
-        {
-            "slide_type": "title_page",
-            "fields": {
-                "title": "Q4 Business Review",
-                "subtitle": "October 25, 2025",
-                "presenter": "Jane Smith, CEO"
-            }
-        },
-        {
-            "slide_type": "section_break",
-            "fields": {
-                "section_title": "Executive Summary"
-            }
-        },
-        {
-            "slide_type": "content",
-            "fields": {
-                "heading": "Key Achievements",
-                "body": "This quarter we achieved significant growth across all business units.",
-                "bullet_points": [
-                    "Revenue increased 25% YoY",
-                    "Launched 3 new products",
-                    "Expanded to 5 new markets",
-                    "Customer satisfaction at all-time high"
-                ]
-            }
-        },
-        {
-            "slide_type": "two_column",
-            "fields": {
-                "heading": "Opportunities & Challenges",
-                "left_heading": "Opportunities",
-                "left_content": "• Growing market demand\n• Strategic partnerships\n• Technology innovations\n• Emerging markets",
-                "right_heading": "Challenges",
-                "right_content": "• Competitive pressure\n• Supply chain issues\n• Talent acquisition\n• Regulatory changes"
-            }
-        },
-        {
-            "slide_type": "section_break",
-            "fields": {
-                "section_title": "Financial Performance"
-            }
-        },
-        {
-            "slide_type": "content",
-            "fields": {
-                "heading": "Revenue & Profit",
-                "body": "Strong financial performance across all metrics.",
-                "bullet_points": [
-                    "Revenue: $50M (↑25%)",
-                    "Gross Margin: 65%",
-                    "Operating Income: $15M",
-                    "Net Profit Margin: 22%"
-                ]
-            }
-        },
-        {
-            "slide_type": "closing",
-            "fields": {
-                "closing_message": "Thank You!",
-                "contact_info": "jane.smith@company.com | (555) 123-4567"
-            }
-        }
-    ]
+    slides_data = (
+        Slide("title_page", {
+            "title": "Q4 Business Review",
+            "subtitle": "October 25, 2025",
+            "presenter": "Jane Smith, CEO"
+        }),
+        Slide("section_break", {
+            "section_title": "Executive Summary"
+        }),
+        Slide("content", {
+            "heading": "Key Achievements",
+            "body": "This quarter we achieved significant growth across all business units.",
+            "bullet_points": [
+                "Revenue increased 25% YoY",
+                "Launched 3 new products",
+                "Expanded to 5 new markets",
+                "Customer satisfaction at all-time high"
+            ]
+        }),
+        Slide("two_column", {
+            "heading": "Opportunities & Challenges",
+            "left_heading": "Opportunities",
+            "left_content": "• Growing market demand\n• Strategic partnerships\n• Technology innovations\n• Emerging markets",
+            "right_heading": "Challenges",
+            "right_content": "• Competitive pressure\n• Supply chain issues\n• Talent acquisition\n• Regulatory changes"
+        }),
+        Slide("section_break", {
+            "section_title": "Financial Performance"
+        }),
+        Slide("content", {
+            "heading": "Revenue & Profit",
+            "body": "Strong financial performance across all metrics.",
+            "bullet_points": [
+                "Revenue: $50M (↑25%)",
+                "Gross Margin: 65%",
+                "Operating Income: $15M",
+                "Net Profit Margin: 22%"
+            ]
+        }),
+        Slide("closing", {
+            "closing_message": "Thank You!",
+            "contact_info": "jane.smith@company.com | (555) 123-4567"
+        }),
+    )
     
     # Generate the presentation
     print(f"\n📝 Generating presentation with {len(slides_data)} slides...")
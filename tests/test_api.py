@@ -2,20 +2,18 @@
 
 import pytest
 from fastapi.testclient import TestClient
-from pathlib import Path
-import sys
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from document_generator.api.main import app
 from document_generator.config import settings
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """Create a test client."""
-    return TestClient(app)
+    """Create a test client, shared by all tests in this module."""
+    # Imported here so building the app isn't paid for at collection time
+    from document_generator.api.main import app
+    
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 def test_root_endpoint(client):
@@ -44,11 +42,12 @@ def test_list_templates(client):
     assert isinstance(data, list)
 
 
-def test_generate_document_missing_template(client):
+@pytest.mark.parametrize("document_type", ["word", "excel", "powerpoint"])
+def test_generate_document_missing_template(client, document_type):
     """Test generating a document with a missing template."""
     request_data = {
         "template_name": "nonexistent",
-        "document_type": "word",
+        "document_type": document_type,
         "fields": {"test": "value"},
         "return_type": "download_link"
     }
@@ -56,7 +55,57 @@ def test_generate_document_missing_template(client):
     assert response.status_code == 400
 
 
+def test_generate_batch_reports_each_document(client):
+    """Test that batch generation returns one response per request."""
+    request_data = [
+        {
+            "template_name": "nonexistent",
+            "document_type": "word",
+            "fields": {"test": "value"},
+            "return_type": "download_link"
+        },
+        {
+            "template_name": "nonexistent",
+            "document_type": "excel",
+            "fields": {"test": "value"},
+            "return_type": "download_link"
+        },
+    ]
+    response = client.post("/api/generate/batch", json=request_data)
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 2
+    assert all(item["success"] is False for item in data)
+
+
 def test_download_nonexistent_file(client):
     """Test downloading a file that doesn't exist."""
     response = client.get("/api/download/nonexistent.docx")
     assert response.status_code == 404
+
+
+def test_list_templates_follows_directory_changes(tmp_path, monkeypatch):
+    """Test that the cached template listing picks up added, edited and removed templates."""
+    from docx import Document
+    from document_generator.api.document_service import DocumentService
+    
+    monkeypatch.setattr(settings, "templates_dir", tmp_path)
+    service = DocumentService()
+    
+    def write_template(name, text):
+        doc = Document()
+        doc.add_paragraph(text)
+        doc.save(tmp_path / f"{name}.docx")
+    
+    write_template("letter", "{{name}}")
+    assert [(t.name, t.fields) for t in service.list_templates()] == [("letter", ["name"])]
+    
+    write_template("letter", "{{name}} {{date}}")
+    write_template("memo", "{{subject}}")
+    assert [(t.name, t.fields) for t in service.list_templates()] == [
+        ("letter", ["date", "name"]),
+        ("memo", ["subject"]),
+    ]
+    
+    (tmp_path / "letter.docx").unlink()
+    assert [t.name for t in service.list_templates()] == ["memo"]
@@ -1,33 +1,294 @@
 """Tests for document generators."""
 
-import pytest
-from pathlib import Path
-import tempfile
-import sys
+import json
+import zipfile
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
 from document_generator.generators import WordGenerator, ExcelGenerator, PowerPointGenerator
+from document_generator.generators.powerpoint_advanced_generator import PowerPointAdvancedGenerator
 
 
-def test_word_generator_instantiation():
-    """Test that WordGenerator can be instantiated."""
-    generator = WordGenerator()
+@pytest.mark.parametrize("generator_class", [WordGenerator, ExcelGenerator, PowerPointGenerator])
+def test_generator_instantiation(generator_class):
+    """Test that each generator can be instantiated."""
+    generator = generator_class()
     assert generator is not None
 
 
-def test_excel_generator_instantiation():
-    """Test that ExcelGenerator can be instantiated."""
+def _make_advanced_template(path, body="{{body}}", slide_type="content"):
+    """Write a one-slide advanced PowerPoint template of the given slide type."""
+    from pptx import Presentation
+    from pptx.util import Inches
+    
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide.shapes.add_textbox(Inches(1), Inches(1), Inches(6), Inches(2)).text_frame.text = body
+    slide.notes_slide.notes_text_frame.text = json.dumps({
+        "slide_type": slide_type,
+        "placeholders": {"body": {"type": "paragraph"}},
+    })
+    prs.save(path)
+    return path
+
+
+def test_advanced_powerpoint_multiline_value_uses_line_breaks(tmp_path):
+    """Test that a multi-line paragraph value becomes <a:br/> line breaks, not raw newlines."""
+    template = _make_advanced_template(tmp_path / "advanced.pptx")
+    output = tmp_path / "out.pptx"
+    
+    PowerPointAdvancedGenerator().generate_from_slides(
+        template, [{"slide_type": "content", "fields": {"body": "first\nsecond"}}], output
+    )
+    
+    with zipfile.ZipFile(output) as archive:
+        slide_xml = archive.read("ppt/slides/slide1.xml").decode("utf-8")
+    assert "<a:br" in slide_xml
+    assert "first\nsecond" not in slide_xml
+    assert ">first</a:t>" in slide_xml and ">second</a:t>" in slide_xml
+
+
+def test_advanced_powerpoint_multiline_value_beside_split_placeholder():
+    """Test that a multi-line value and a placeholder split across runs share a paragraph cleanly."""
+    from pptx import Presentation
+    from pptx.util import Inches
+    
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    text_frame = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(6), Inches(2)).text_frame
+    for text in ("{{body}} and {{ti", "tle}}"):
+        text_frame.paragraphs[0].add_run().text = text
+    
+    generator = PowerPointAdvancedGenerator()
+    generator._replace_all_text_in_slide(
+        generator._classify_shapes(slide), {"{{body}}": "a\nb", "{{title}}": "T"}
+    )
+    
+    assert text_frame.text == "a\vb and T"
+
+
+def _make_excel_template(path, cells):
+    """Write a one-sheet Excel template with the given {coordinate: value} cells."""
+    from openpyxl import Workbook
+    
+    wb = Workbook()
+    for coordinate, value in cells.items():
+        wb.active[coordinate] = value
+    wb.save(path)
+    return path
+
+
+def test_excel_template_replaced_during_generate(tmp_path):
+    """Test that generate() stats the template once, so a swap can't split the workbook from the cell cache."""
+    from openpyxl import load_workbook
+    
+    template = _make_excel_template(tmp_path / "sheet.xlsx", {"A1": "{{name}}"})
+    
+    class CountingGenerator(ExcelGenerator):
+        calls = 0
+        
+        def _template_key(self, template_path):
+            self.calls += 1
+            return super()._template_key(template_path)
+    
+    generator = CountingGenerator()
+    generator.generate(template, {"name": "Ada"}, tmp_path / "first.xlsx")
+    assert generator.calls == 1
+    
+    # Later requests see the new template and must fill its cells
+    _make_excel_template(template, {"B2": "Dear {{name}},"})
+    output = generator.generate(template, {"name": "Ada"}, tmp_path / "second.xlsx")
+    assert generator.calls == 2
+    assert load_workbook(output).active["B2"].value == "Dear Ada,"
+
+
+def test_word_generate_fills_every_advertised_field(tmp_path):
+    """Test that generate() replaces every field get_template_fields() reports."""
+    from docx import Document
+    
+    doc = Document()
+    doc.add_paragraph("{{top}}")
+    outer = doc.add_table(rows=1, cols=1)
+    outer.cell(0, 0).add_table(rows=1, cols=1).cell(0, 0).text = "{{nested}}"
+    section = doc.sections[0]
+    section.different_first_page_header_footer = True
+    section.first_page_header.paragraphs[0].text = "{{firsthdr}}"
+    section.footer.paragraphs[0].text = "{{foot}}"
+    template = tmp_path / "letter.docx"
+    doc.save(template)
+    
+    generator = WordGenerator()
+    fields = generator.get_template_fields(template)
+    assert fields == ["firsthdr", "foot", "nested", "top"]
+    
+    output = generator.generate(template, {name: f"<{name}>" for name in fields}, tmp_path / "out.docx")
+    assert generator.get_template_fields(output) == []
+
+
+def test_excel_fields_come_from_cells_only(tmp_path):
+    """Test that header/footer text isn't reported, and that every reported field is filled."""
+    from openpyxl import Workbook
+    
+    wb = Workbook()
+    ws = wb.active
+    ws["A1"] = "{{name}}"
+    ws["B2"] = "Total: {{total}}"
+    ws.oddHeader.center.text = "{{hdr}}"
+    template = tmp_path / "report.xlsx"
+    wb.save(template)
+    
     generator = ExcelGenerator()
-    assert generator is not None
+    fields = generator.get_template_fields(template)
+    assert fields == ["name", "total"]
+    
+    output = generator.generate(template, {name: "x" for name in fields}, tmp_path / "out.xlsx")
+    assert generator.get_template_fields(output) == []
 
 
-def test_powerpoint_generator_instantiation():
-    """Test that PowerPointGenerator can be instantiated."""
-    generator = PowerPointGenerator()
-    assert generator is not None
+def test_advanced_powerpoint_parses_notes_once_per_template_version(tmp_path):
+    """Test that slide metadata is reused across calls and re-read when the template changes."""
+    template = _make_advanced_template(tmp_path / "advanced.pptx")
+    
+    class CountingGenerator(PowerPointAdvancedGenerator):
+        parses = 0
+        
+        def parse_slide_metadata(self, slide):
+            self.parses += 1
+            return super().parse_slide_metadata(slide)
+    
+    generator = CountingGenerator()
+    slides = [{"slide_type": "content", "fields": {"body": "text"}}]
+    for index in range(3):
+        generator.generate_from_slides(template, slides, tmp_path / f"out{index}.pptx")
+    generator.get_template_slide_types(template)
+    assert generator.parses == 1
+    
+    _make_advanced_template(template, body="Updated {{body}}")
+    generator.generate_from_slides(template, slides, tmp_path / "changed.pptx")
+    assert generator.parses == 2
+
+
+def test_advanced_powerpoint_slide_types_follow_template_edits(tmp_path):
+    """Test that cached slide types are rebuilt when the template changes."""
+    generator = PowerPointAdvancedGenerator()
+    template = _make_advanced_template(tmp_path / "advanced.pptx")
+    assert [info["slide_type"] for info in generator.get_template_slide_types(template)] == ["content"]
+    assert generator.get_template_fields(template) == ["body"]
+    
+    _make_advanced_template(template, body="{{summary}}", slide_type="closing")
+    assert [info["slide_type"] for info in generator.get_template_slide_types(template)] == ["closing"]
+    assert generator.get_template_fields(template) == ["summary"]
+
+
+def test_advanced_powerpoint_slide_types_are_copies(tmp_path):
+    """Test that modifying returned slide types doesn't affect later generation."""
+    generator = PowerPointAdvancedGenerator()
+    template = _make_advanced_template(tmp_path / "advanced.pptx")
+    slide_types = generator.get_template_slide_types(template)
+    slide_types[0]["slide_type"] = "changed"
+    slide_types[0]["placeholders"].clear()
+    
+    assert generator.get_template_slide_types(template)[0]["slide_type"] == "content"
+    assert generator.get_template_slide_types(template)[0]["placeholders"] == {"body": {"type": "paragraph"}}
+    output = generator.generate_from_slides(
+        template, [{"slide_type": "content", "fields": {"body": "text"}}], tmp_path / "out.pptx"
+    )
+    assert generator.get_template_fields(output) == []
+
+
+def test_advanced_powerpoint_generate_replaces_fields(tmp_path):
+    """Test that the legacy generate() fills placeholders across the whole template."""
+    from pptx import Presentation
+    
+    template = _make_advanced_template(tmp_path / "advanced.pptx", body="Hello {{body}}")
+    output = PowerPointAdvancedGenerator().generate(template, {"body": "world"}, tmp_path / "out.pptx")
+    
+    texts = [shape.text_frame.text for shape in Presentation(output).slides[0].shapes]
+    assert texts == ["Hello world"]
+
+
+def test_template_bytes_cache_keeps_one_version_per_path(tmp_path, monkeypatch):
+    """Test that a changed template replaces its cached bytes and the cache stays within its byte budget."""
+    from document_generator.generators import base
+    
+    monkeypatch.setattr(base, "_TEMPLATE_BYTES", base._TemplateCache(max_entries=8, max_weight=10, weigh=len))
+    generator = WordGenerator()
+    
+    template = tmp_path / "a.bin"
+    template.write_bytes(b"v1")
+    assert generator._open_template(generator._template_key(template)).read() == b"v1"
+    template.write_bytes(b"v2-new")
+    assert generator._open_template(generator._template_key(template)).read() == b"v2-new"
+    assert list(base._TEMPLATE_BYTES._entries) == [str(template)]
+    
+    other = tmp_path / "b.bin"
+    other.write_bytes(b"other")
+    assert generator._open_template(generator._template_key(other)).read() == b"other"
+    # 6 + 5 bytes exceed the budget, so the least recently used file is dropped
+    assert list(base._TEMPLATE_BYTES._entries) == [str(other)]
+
+
+def _make_word_template(path, text):
+    """Write a Word template with a single paragraph."""
+    from docx import Document
+    
+    doc = Document()
+    doc.add_paragraph(text)
+    doc.save(path)
+    return path
+
+
+def _make_powerpoint_template(path, text):
+    """Write a PowerPoint template with a single text box."""
+    from pptx import Presentation
+    from pptx.util import Inches
+    
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide.shapes.add_textbox(Inches(1), Inches(1), Inches(6), Inches(1)).text_frame.text = text
+    prs.save(path)
+    return path
+
+
+@pytest.mark.parametrize(
+    "generator_class, make_template, extension",
+    [
+        (WordGenerator, _make_word_template, ".docx"),
+        (ExcelGenerator, lambda path, text: _make_excel_template(path, {"A1": text}), ".xlsx"),
+        (PowerPointGenerator, _make_powerpoint_template, ".pptx"),
+    ],
+)
+def test_template_edited_on_disk_updates_fields_and_output(tmp_path, generator_class, make_template, extension):
+    """Test that cached template data follows edits, and extracted fields are exactly what generate() fills."""
+    generator = generator_class()
+    template = make_template(tmp_path / f"template{extension}", "Hello {{name}}")
+    
+    assert generator.get_template_fields(template) == ["name"]
+    first = generator.generate(template, {"name": "Ada"}, tmp_path / f"first{extension}")
+    assert generator.get_template_fields(first) == []
+    
+    make_template(template, "{{greeting}}, {{person}}!")
+    
+    fields = generator.get_template_fields(template)
+    assert fields == ["greeting", "person"]
+    second = generator.generate(template, {name: "x" for name in fields}, tmp_path / f"second{extension}")
+    assert generator.get_template_fields(second) == []
 
 
-# Additional tests would require actual template files
-# These would be integration tests run after templates are created
+@pytest.mark.parametrize(
+    "generator_class, make_template, extension",
+    [
+        (WordGenerator, _make_word_template, ".docx"),
+        (ExcelGenerator, lambda path, text: _make_excel_template(path, {"A1": text}), ".xlsx"),
+        (PowerPointGenerator, _make_powerpoint_template, ".pptx"),
+        (PowerPointAdvancedGenerator, lambda path, text: _make_advanced_template(path, body=text), ".pptx"),
+    ],
+)
+def test_generators_accept_str_paths(tmp_path, generator_class, make_template, extension):
+    """Test that template and output paths may be given as strings."""
+    generator = generator_class()
+    template = str(make_template(tmp_path / f"template{extension}", "Hello {{name}}"))
+    
+    assert generator.get_template_fields(template) == ["name"]
+    output = generator.generate(template, {"name": "Ada"}, str(tmp_path / f"out{extension}"))
+    assert generator.get_template_fields(output) == []
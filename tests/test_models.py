@@ -1,11 +1,6 @@
 """Tests for data models."""
 
 import pytest
-import sys
-from pathlib import Path
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from document_generator.models import (
     GenerateDocumentRequest,
@@ -14,28 +9,26 @@ from document_generator.models import (
 )
 
 
-def test_generate_document_request_creation():
-    """Test creating a GenerateDocumentRequest."""
+@pytest.mark.parametrize(
+    "document_type, fields, extra, expected_return_type",
+    [
+        ("word", {"name": "John", "date": "2024-01-01"}, {"return_type": "binary"}, "binary"),
+        # return_type omitted falls back to the default
+        ("excel", {"value": "100"}, {}, "binary"),
+    ],
+)
+def test_generate_document_request_creation(document_type, fields, extra, expected_return_type):
+    """Test creating a GenerateDocumentRequest, with and without an explicit return_type."""
     request = GenerateDocumentRequest(
         template_name="test",
-        document_type="word",
-        fields={"name": "John", "date": "2024-01-01"},
-        return_type="binary"
+        document_type=document_type,
+        fields=fields,
+        **extra
     )
     assert request.template_name == "test"
-    assert request.document_type == "word"
-    assert request.fields["name"] == "John"
-    assert request.return_type == "binary"
-
-
-def test_generate_document_request_default_return_type():
-    """Test default return_type in GenerateDocumentRequest."""
-    request = GenerateDocumentRequest(
-        template_name="test",
-        document_type="excel",
-        fields={"value": "100"}
-    )
-    assert request.return_type == "binary"
+    assert request.document_type == document_type
+    assert request.fields == fields
+    assert request.return_type == expected_return_type
 
 
 def test_generate_document_response_creation():
@@ -5,218 +5,357 @@ Installation verification script for Document Generator.
 This script checks if all dependencies are installed and the system is properly configured.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import importlib.util
+import json
+import os
+import site
 import sys
-from pathlib import Path
+import time
+
+
+# Project root, resolved once for all checks. Kept as a plain string: the
+# checks only join and list paths, which os.path does without building
+# Path objects
+BASE_DIR = os.path.dirname(os.path.realpath(__file__))
+
+# Make the package importable when run from a checkout; done once here rather
+# than by every check that imports it
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+
+# Results of the import-heavy checks are remembered between runs for an hour,
+# as long as the interpreter, its site-packages and the package sources are
+# unchanged. Only passing results are stored, so failures are always re-checked.
+_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "document_generator", "verify.json")
+_CACHE_TTL_SECONDS = 3600
+_CACHED_CHECKS = ("Dependencies", "API Imports", "MCP Imports")
+
+
+# (import name, description) of each required package
+DEPENDENCIES = (
+    ("fastapi", "FastAPI web framework"),
+    ("uvicorn", "ASGI server"),
+    ("pydantic", "Data validation"),
+    ("pydantic_settings", "Settings management"),
+    ("docx", "Word document processing (python-docx)"),
+    ("openpyxl", "Excel document processing"),
+    ("pptx", "PowerPoint document processing (python-pptx)"),
+    ("mcp", "Model Context Protocol"),
+)
+
+# (path relative to BASE_DIR, description) of each required directory
+REQUIRED_DIRS = (
+    ("templates", "Template storage directory"),
+    ("document_generator", "Main package directory"),
+    ("document_generator/api", "API module"),
+    ("document_generator/generators", "Generator modules"),
+    ("document_generator/mcp_server", "MCP server module"),
+    ("examples", "Example scripts"),
+    ("tests", "Test suite"),
+)
+
+# Directories to list so every entry of REQUIRED_DIRS can be looked up
+_REQUIRED_DIR_PARENTS = tuple(sorted({path.rpartition("/")[0] for path, _ in REQUIRED_DIRS}))
+
+
+# Rule printed above and below every section header
+_SEP = "=" * 60
+
+
+def format_header(text):
+    """Format a section header."""
+    return f"\n{_SEP}\n  {text}\n{_SEP}"
 
 
 def print_header(text):
     """Print a section header."""
-    print(f"\n{'=' * 60}")
-    print(f"  {text}")
-    print('=' * 60)
+    print(format_header(text))
 
 
+# Each check returns (passed, log) instead of printing, so main() can run
+# them concurrently and still print their reports in a fixed order
+
 def check_python_version():
     """Check Python version."""
-    print_header("Python Version Check")
+    log = [format_header("Python Version Check")]
     version = sys.version_info
-    print(f"Python version: {version.major}.{version.minor}.{version.micro}")
+    log.append(f"Python version: {version.major}.{version.minor}.{version.micro}")
     
-    if version.major < 3 or (version.major == 3 and version.minor < 9):
-        print("❌ Python 3.9 or higher is required")
-        return False
+    compatible = version >= (3, 9)
+    if compatible:
+        log.append("✅ Python version is compatible")
     else:
-        print("✅ Python version is compatible")
-        return True
+        log.append("❌ Python 3.9 or higher is required")
+    return compatible, "\n".join(log)
 
 
 def check_dependencies():
     """Check if required dependencies are installed."""
-    print_header("Dependency Check")
-    
-    dependencies = [
-        ("fastapi", "FastAPI web framework"),
-        ("uvicorn", "ASGI server"),
-        ("pydantic", "Data validation"),
-        ("pydantic_settings", "Settings management"),
-        ("docx", "Word document processing (python-docx)"),
-        ("openpyxl", "Excel document processing"),
-        ("pptx", "PowerPoint document processing (python-pptx)"),
-        ("mcp", "Model Context Protocol"),
-    ]
+    log = [format_header("Dependency Check")]
     
     all_installed = True
-    for module_name, description in dependencies:
-        try:
-            __import__(module_name)
-            print(f"✅ {module_name:20s} - {description}")
-        except ImportError:
-            print(f"❌ {module_name:20s} - {description} (NOT INSTALLED)")
+    for module_name, description in DEPENDENCIES:
+        # find_spec() only locates the module; importing it would run every
+        # package's top-level code, and the import checks below do that anyway.
+        # It is also far cheaper than listing importlib.metadata.distributions(),
+        # which parses the metadata of every installed package.
+        if importlib.util.find_spec(module_name) is not None:
+            log.append(f"✅ {module_name:20s} - {description}")
+        else:
+            log.append(f"❌ {module_name:20s} - {description} (NOT INSTALLED)")
             all_installed = False
     
     if not all_installed:
-        print("\n⚠️  Some dependencies are missing.")
-        print("   Run: pip install -r requirements.txt")
+        log.append("\n⚠️  Some dependencies are missing.")
+        log.append("   Run: pip install -r requirements.txt")
     
-    return all_installed
+    return all_installed, "\n".join(log)
 
 
 def check_directory_structure():
     """Check if required directories exist."""
-    print_header("Directory Structure Check")
-    
-    base_dir = Path(__file__).parent
-    required_dirs = [
-        ("templates", "Template storage directory"),
-        ("document_generator", "Main package directory"),
-        ("document_generator/api", "API module"),
-        ("document_generator/generators", "Generator modules"),
-        ("document_generator/mcp_server", "MCP server module"),
-        ("examples", "Example scripts"),
-        ("tests", "Test suite"),
-    ]
+    log = [format_header("Directory Structure Check")]
+    
+    # Read each parent directory once, rather than stat-ing every required path
+    found = set()
+    for parent in _REQUIRED_DIR_PARENTS:
+        try:
+            with os.scandir(os.path.join(BASE_DIR, parent)) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        found.add(f"{parent}/{entry.name}" if parent else entry.name)
+        except FileNotFoundError:
+            pass
     
     all_exist = True
-    for dir_path, description in required_dirs:
-        full_path = base_dir / dir_path
-        if full_path.exists():
-            print(f"✅ {dir_path:30s} - {description}")
+    for dir_path, description in REQUIRED_DIRS:
+        if dir_path in found:
+            log.append(f"✅ {dir_path:30s} - {description}")
         else:
-            print(f"❌ {dir_path:30s} - {description} (MISSING)")
+            log.append(f"❌ {dir_path:30s} - {description} (MISSING)")
             all_exist = False
     
-    return all_exist
+    return all_exist, "\n".join(log)
 
 
 def check_configuration():
     """Check configuration."""
-    print_header("Configuration Check")
+    log = [format_header("Configuration Check")]
     
     try:
-        sys.path.insert(0, str(Path(__file__).parent))
         from document_generator.config import settings
         
-        print(f"✅ Configuration loaded successfully")
-        print(f"   Templates directory: {settings.templates_dir}")
-        print(f"   Output directory: {settings.output_dir}")
-        print(f"   API port: {settings.port}")
-        print(f"   Base URL: {settings.base_url}")
+        log.append(f"✅ Configuration loaded successfully")
+        log.append(f"   Templates directory: {settings.templates_dir}")
+        log.append(f"   Output directory: {settings.output_dir}")
+        log.append(f"   API port: {settings.port}")
+        log.append(f"   Base URL: {settings.base_url}")
         
         # Check if directories are writable
         try:
-            settings.templates_dir.mkdir(parents=True, exist_ok=True)
-            settings.output_dir.mkdir(parents=True, exist_ok=True)
-            print(f"✅ Directories are writable")
+            for directory in (settings.templates_dir, settings.output_dir):
+                # Usually both exist already; a stat is cheaper than a mkdir
+                # that fails with EEXIST, and os.access() checks what we
+                # actually care about
+                if not os.path.isdir(directory):
+                    os.makedirs(directory, exist_ok=True)
+                elif not os.access(directory, os.W_OK):
+                    raise PermissionError(f"{directory} is not writable")
+            log.append(f"✅ Directories are writable")
         except Exception as e:
-            print(f"❌ Directory permission error: {e}")
-            return False
+            log.append(f"❌ Directory permission error: {e}")
+            return False, "\n".join(log)
         
-        return True
+        return True, "\n".join(log)
     except ImportError as e:
-        print(f"❌ Configuration import failed: {e}")
-        return False
+        log.append(f"❌ Configuration import failed: {e}")
+        return False, "\n".join(log)
 
 
 def check_templates():
     """Check if templates exist."""
-    print_header("Template Check")
+    log = [format_header("Template Check")]
     
-    base_dir = Path(__file__).parent
-    templates_dir = base_dir / "templates"
+    templates_dir = os.path.join(BASE_DIR, "templates")
     
-    if not templates_dir.exists():
-        print("⚠️  Templates directory not found")
-        print("   Run: python examples/create_templates.py")
-        return False
+    # One directory read; the entries' cached types spare a stat per file
+    try:
+        with os.scandir(templates_dir) as entries:
+            template_names = [
+                entry.name for entry in entries
+                if "." in entry.name and not entry.name.startswith(".") and entry.is_file()
+            ]
+    except FileNotFoundError:
+        log.append("⚠️  Templates directory not found")
+        log.append("   Run: python examples/create_templates.py")
+        return False, "\n".join(log)
     
-    template_files = list(templates_dir.glob("*.*"))
-    if not template_files:
-        print("⚠️  No templates found")
-        print("   Run: python examples/create_templates.py")
-        return False
+    if not template_names:
+        log.append("⚠️  No templates found")
+        log.append("   Run: python examples/create_templates.py")
+        return False, "\n".join(log)
     
-    print(f"✅ Found {len(template_files)} template(s):")
-    for template in template_files:
-        print(f"   - {template.name}")
+    log.append(f"✅ Found {len(template_names)} template(s):")
+    for name in template_names:
+        log.append(f"   - {name}")
     
-    return True
+    return True, "\n".join(log)
 
 
 def check_api_imports():
     """Check if API can be imported."""
-    print_header("API Import Check")
+    log = [format_header("API Import Check")]
     
     try:
-        sys.path.insert(0, str(Path(__file__).parent))
         from document_generator.api.main import app
-        print("✅ FastAPI application imported successfully")
+        log.append("✅ FastAPI application imported successfully")
         
         from document_generator.api.document_service import DocumentService
-        print("✅ Document service imported successfully")
+        log.append("✅ Document service imported successfully")
         
-        return True
+        return True, "\n".join(log)
     except ImportError as e:
-        print(f"❌ API import failed: {e}")
-        return False
+        log.append(f"❌ API import failed: {e}")
+        return False, "\n".join(log)
 
 
 def check_mcp_imports():
     """Check if MCP server can be imported."""
-    print_header("MCP Server Import Check")
+    log = [format_header("MCP Server Import Check")]
     
     try:
-        sys.path.insert(0, str(Path(__file__).parent))
         from document_generator.mcp_server.server import DocumentGeneratorMCPServer
-        print("✅ MCP server imported successfully")
-        return True
+        log.append("✅ MCP server imported successfully")
+        return True, "\n".join(log)
     except ImportError as e:
-        print(f"❌ MCP server import failed: {e}")
-        return False
+        log.append(f"❌ MCP server import failed: {e}")
+        return False, "\n".join(log)
+
+
+def _cache_key():
+    """Fingerprint the environment the cached check results depend on."""
+    parts = [sys.executable, sys.version, BASE_DIR]
+    
+    # Installing or removing a package changes its site-packages directory
+    site_dirs = site.getsitepackages() if hasattr(site, "getsitepackages") else []
+    for site_dir in [*site_dirs, site.getusersitepackages()]:
+        try:
+            parts.append(f"{site_dir}:{os.stat(site_dir).st_mtime_ns}")
+        except OSError:
+            pass
+    
+    # Editing the package can break the API and MCP imports
+    for root, _, files in os.walk(os.path.join(BASE_DIR, "document_generator")):
+        for name in files:
+            if name.endswith(".py"):
+                path = os.path.join(root, name)
+                parts.append(f"{path}:{os.stat(path).st_mtime_ns}")
+    
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def _load_cached_results(key):
+    """Return the cached {check name: (passed, log)} for key, or {} if missing or stale."""
+    try:
+        with open(_CACHE_PATH, encoding="utf-8") as f:
+            cache = json.load(f)
+        if cache["key"] != key or time.time() - cache["created"] > _CACHE_TTL_SECONDS:
+            return {}
+        return {name: (passed, log) for name, (passed, log) in cache["results"].items()}
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+
+
+def _store_cached_results(key, results):
+    """Remember the cacheable checks' results, if they all passed."""
+    if not all(passed for passed, _ in results.values()):
+        return
+    try:
+        os.makedirs(os.path.dirname(_CACHE_PATH), exist_ok=True)
+        temp_path = _CACHE_PATH + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"key": key, "created": time.time(), "results": results}, f)
+        os.replace(temp_path, _CACHE_PATH)
+    except OSError:
+        # The cache is only an optimization; never fail the checks over it
+        pass
 
 
 def print_summary(checks):
     """Print summary of all checks."""
-    print_header("Summary")
+    log = [format_header("Summary")]
     
     passed = sum(1 for result in checks.values() if result)
     total = len(checks)
     
-    print(f"\nPassed: {passed}/{total} checks")
+    log.append(f"\nPassed: {passed}/{total} checks")
     
     if passed == total:
-        print("\n✅ All checks passed! The system is ready to use.")
-        print("\nNext steps:")
-        print("  1. Start the API server:")
-        print("     ./run_api.sh")
-        print("     or")
-        print("     python -m document_generator.api.main")
-        print("\n  2. Visit http://localhost:8000/docs for API documentation")
-        print("\n  3. Try the examples:")
-        print("     python examples/api_example.py")
+        log.append("\n✅ All checks passed! The system is ready to use.")
+        log.append("\nNext steps:")
+        log.append("  1. Start the API server:")
+        log.append("     ./run_api.sh")
+        log.append("     or")
+        log.append("     python -m document_generator.api.main")
+        log.append("\n  2. Visit http://localhost:8000/docs for API documentation")
+        log.append("\n  3. Try the examples:")
+        log.append("     python examples/api_example.py")
     else:
-        print("\n⚠️  Some checks failed. Please address the issues above.")
-        print("\nCommon solutions:")
-        print("  - Install dependencies: pip install -r requirements.txt")
-        print("  - Create templates: python examples/create_templates.py")
-        print("  - Check Python version: python --version (requires 3.9+)")
+        log.append("\n⚠️  Some checks failed. Please address the issues above.")
+        log.append("\nCommon solutions:")
+        log.append("  - Install dependencies: pip install -r requirements.txt")
+        log.append("  - Create templates: python examples/create_templates.py")
+        log.append("  - Check Python version: python --version (requires 3.9+)")
+    
+    sys.stdout.write("\n".join(log) + "\n")
 
 
 def main():
     """Run all verification checks."""
-    print("\n" + "=" * 60)
-    print("  Document Generator Installation Verification")
-    print("=" * 60)
-    
-    checks = {
-        "Python Version": check_python_version(),
-        "Dependencies": check_dependencies(),
-        "Directory Structure": check_directory_structure(),
-        "Configuration": check_configuration(),
-        "Templates": check_templates(),
-        "API Imports": check_api_imports(),
-        "MCP Imports": check_mcp_imports(),
+    print_header("Document Generator Installation Verification")
+    
+    # On an unsupported interpreter the other checks would only fail with
+    # confusing import or syntax errors, so stop after reporting the version
+    version_ok, version_log = check_python_version()
+    sys.stdout.write(version_log + "\n")
+    if not version_ok:
+        print_summary({"Python Version": False})
+        sys.exit(1)
+    
+    checks_to_run = {
+        "Dependencies": check_dependencies,
+        "Directory Structure": check_directory_structure,
+        "Configuration": check_configuration,
+        "Templates": check_templates,
+        "API Imports": check_api_imports,
+        "MCP Imports": check_mcp_imports,
     }
     
+    cache_key = _cache_key()
+    cached = _load_cached_results(cache_key)
+    
+    with ThreadPoolExecutor(max_workers=len(checks_to_run)) as executor:
+        futures = {
+            name: executor.submit(check)
+            for name, check in checks_to_run.items()
+            if name not in cached
+        }
+        
+        checks = {"Python Version": version_ok}
+        results = {}
+        for name in checks_to_run:
+            passed, log = cached[name] if name in cached else futures[name].result()
+            # Each report goes out in one write
+            sys.stdout.write(log + "\n")
+            checks[name] = passed
+            results[name] = (passed, log)
+    
+    if not cached:
+        _store_cached_results(cache_key, {name: results[name] for name in _CACHED_CHECKS})
+    
     print_summary(checks)
     
     # Return exit code